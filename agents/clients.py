@@ -0,0 +1,39 @@
+"""
+Shared Anthropic clients for the writer and hourly summary agents.
+
+Clients are cached per API key so repeated calls reuse one connection
+pool instead of paying a fresh TLS handshake each time.
+"""
+
+import asyncio
+import threading
+import weakref
+
+import anthropic
+
+# Anthropic clients, one per API key
+_clients = {}
+_clients_lock = threading.Lock()
+
+# AsyncAnthropic clients, one per (event loop, API key). The underlying
+# httpx pool is bound to the loop it was created on, so clients can't be
+# shared across separate asyncio.run() calls.
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def get_client(api_key):
+    """Return the shared Anthropic client for api_key, creating it on first use."""
+    with _clients_lock:
+        client = _clients.get(api_key)
+        if client is None:
+            client = _clients[api_key] = anthropic.Anthropic(api_key=api_key)
+    return client
+
+
+def get_async_client(api_key):
+    """Return a cached AsyncAnthropic client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    clients = _async_clients.setdefault(loop, {})
+    if api_key not in clients:
+        clients[api_key] = anthropic.AsyncAnthropic(api_key=api_key)
+    return clients[api_key]
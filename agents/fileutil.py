@@ -0,0 +1,22 @@
+"""
+File helpers shared by the media agents' on-disk caches.
+"""
+
+import os
+import shutil
+
+
+def link_or_copy(src, dest):
+    """Hard-link src to dest (copy if linking fails). Returns True on success."""
+    try:
+        if os.path.lexists(dest):
+            os.remove(dest)
+        os.link(src, dest)
+        return True
+    except OSError:
+        pass
+    try:
+        shutil.copyfile(src, dest)
+        return True
+    except OSError:
+        return False
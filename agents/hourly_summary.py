@@ -7,14 +7,50 @@ alternating segments.
 """
 
 import anthropic
+import hashlib
 import json
+import os
 import random
 import re
+import threading
+import time
 import uuid
 from datetime import datetime
 
+from agents.clients import get_async_client, get_client
 
-def generate_hourly_summary(stories, config, world_bible, video_mode=False):
+# Message Batches polling (batched hourly jobs are scheduled, not real-time)
+BATCH_POLL_INTERVAL_SECONDS = 30
+MAX_BATCH_POLL_ATTEMPTS = 60  # 60 * 30s = 30 minutes max wait
+
+SUMMARY_MODEL = "claude-sonnet-4-20250514"
+
+# Optimized-latency inference (config: apis.anthropic_latency_mode, opt-in;
+# the default is standard). Models that reject it are remembered and
+# served in standard mode.
+_OPTIMIZED_LATENCY = {"performance_config": {"latency": "optimized"}}
+_latency_unsupported = set()
+
+# Exact-match cache of raw Claude scripts, keyed by a hash of the prompt
+# inputs (config: cache.hourly_ttl seconds, 0 disables)
+HOURLY_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "cache", "hourly_summary"
+)
+DEFAULT_HOURLY_CACHE_TTL = 3600
+
+# Precompiled script-cleanup patterns
+_TAG_STRIP = re.compile(r'\[[A-Z_-]+:\s*[^\]]+\]')
+_ANCHOR_TAG = re.compile(r'\[(ANCHOR_[AB])\]')
+# Per-segment cleanup in one pass: **bold** → text, [CHYRON/B-ROLL: ...] → ''
+_SEGMENT_CLEAN = re.compile(r'\*\*([^*]+)\*\*|\[(?:CHYRON|B-ROLL):\s*[^\]]+\]')
+
+# Per-thread RNGs (see _get_rng) so concurrent channels don't share state
+_thread_local = threading.local()
+
+
+def generate_hourly_summary(stories, config, world_bible, video_mode=False, rng=None,
+                            hour_label=None, batch_seed=None, batch_index=0):
     """
     Generate an hourly news summary from the past hour's stories.
 
@@ -23,6 +59,12 @@ def generate_hourly_summary(stories, config, world_bible, video_mode=False):
         config: channel config
         world_bible: world bible dict
         video_mode: if True, generate a solo-anchor script for HeyGen video
+        rng: optional random.Random for anchor/nonsense picks
+             (defaults to a per-thread instance)
+        hour_label: optional precomputed hour string (defaults to the current hour)
+        batch_seed: optional hex seed shared by summaries generated together;
+                    with batch_index it forms the story_id instead of a fresh UUID
+        batch_index: position of this summary within its batch
 
     Returns a dict with:
         - segments: list of {anchor, text} dicts for TTS
@@ -35,7 +77,163 @@ def generate_hourly_summary(stories, config, world_bible, video_mode=False):
     if not stories:
         return None
 
-    client = anthropic.Anthropic(api_key=config["apis"]["anthropic_key"])
+    request = _prepare_summary_request(stories, config, world_bible, video_mode, rng,
+                                       hour_label, _summary_story_id(batch_seed, batch_index))
+
+    raw_script = _load_cached_script(request)
+    if raw_script is None:
+        client = get_client(config["apis"]["anthropic_key"])
+        message = _create_message(client, request)
+        raw_script = message.content[0].text.strip()
+        _store_cached_script(request, raw_script)
+
+    return _finish_summary(raw_script, request, stories, config, rng)
+
+
+async def generate_hourly_summary_async(stories, config, world_bible, video_mode=False, rng=None,
+                                        hour_label=None, batch_seed=None, batch_index=0):
+    """
+    Async variant of generate_hourly_summary().
+
+    Awaits the Claude call on an AsyncAnthropic client so several summaries
+    (e.g. one per channel) can be generated concurrently with asyncio.gather()
+    instead of blocking the event loop for the full round-trip.
+    Takes the same arguments and returns the same dict.
+    """
+    if not stories:
+        return None
+
+    request = _prepare_summary_request(stories, config, world_bible, video_mode, rng,
+                                       hour_label, _summary_story_id(batch_seed, batch_index))
+
+    raw_script = _load_cached_script(request)
+    if raw_script is None:
+        client = get_async_client(config["apis"]["anthropic_key"])
+        try:
+            message = await client.messages.create(**_create_params(request))
+        except anthropic.BadRequestError as e:
+            message = await client.messages.create(**_latency_fallback_params(e, request))
+        raw_script = message.content[0].text.strip()
+        _store_cached_script(request, raw_script)
+
+    return _finish_summary(raw_script, request, stories, config, rng)
+
+
+def generate_hourly_summaries_batch(stories_per_channel, configs, world_bible, video_mode=False, rng=None):
+    """
+    Generate hourly summaries for several channels in one Message Batch.
+
+    Builds one prompt per channel exactly like generate_hourly_summary(),
+    submits them together through the Anthropic Message Batches API (about
+    half the per-token price), polls until the batch has ended, then runs
+    each result through the same post-processing as the single-call path.
+    Batches trade latency for cost, so use this for scheduled hourly jobs;
+    generate_hourly_summary() remains the real-time path.
+
+    Args:
+        stories_per_channel: list of story lists, one per channel
+        configs: list of channel configs, parallel to stories_per_channel
+        world_bible: world bible dict
+        video_mode: if True, generate solo-anchor scripts for HeyGen video
+        rng: optional random.Random (defaults to a per-thread instance)
+
+    Returns a list parallel to configs of summary dicts (or None for a
+    channel with no stories). Channels whose batch entry errored or did not
+    finish in time fall back to a direct messages.create() call.
+    """
+    results = [None] * len(configs)
+    requests_by_id = {}
+    raw_scripts = {}
+    # Computed once for the whole batch rather than per channel
+    hour_label = _current_hour_label()
+    batch_seed = uuid.uuid4().hex
+    for i, (stories, config) in enumerate(zip(stories_per_channel, configs)):
+        if stories:
+            custom_id = f"channel-{i}"
+            request = _prepare_summary_request(stories, config, world_bible, video_mode, rng,
+                                               hour_label, _summary_story_id(batch_seed, i))
+            requests_by_id[custom_id] = (i, request)
+            cached = _load_cached_script(request)
+            if cached is not None:
+                raw_scripts[custom_id] = cached
+
+    if not requests_by_id:
+        return results
+
+    # One batch is billed to one account — use the first channel's key
+    client = get_client(configs[0]["apis"]["anthropic_key"])
+    pending = {cid: req for cid, (_, req) in requests_by_id.items() if cid not in raw_scripts}
+
+    if pending:
+        try:
+            batch = client.messages.batches.create(requests=[
+                {"custom_id": custom_id, "params": _message_params(request)}
+                for custom_id, request in pending.items()
+            ])
+            print(f"  Hourly batch submitted: {batch.id} ({len(pending)} channels)")
+
+            for _ in range(MAX_BATCH_POLL_ATTEMPTS):
+                if batch.processing_status == "ended":
+                    break
+                time.sleep(BATCH_POLL_INTERVAL_SECONDS)
+                batch = client.messages.batches.retrieve(batch.id)
+
+            if batch.processing_status == "ended":
+                for entry in client.messages.batches.results(batch.id):
+                    if entry.result.type == "succeeded":
+                        raw_script = entry.result.message.content[0].text.strip()
+                        raw_scripts[entry.custom_id] = raw_script
+                        _store_cached_script(pending[entry.custom_id], raw_script)
+                    else:
+                        print(f"  WARNING: Batch entry {entry.custom_id} {entry.result.type}")
+            else:
+                print(f"  WARNING: Hourly batch {batch.id} still {batch.processing_status}, cancelling")
+                client.messages.batches.cancel(batch.id)
+        except anthropic.APIError as e:
+            print(f"  WARNING: Hourly batch failed: {e}")
+
+    for custom_id, (i, request) in requests_by_id.items():
+        raw_script = raw_scripts.get(custom_id)
+        if raw_script is None:
+            # Fallback: single real-time call for this channel, on its own key
+            message = _create_message(get_client(configs[i]["apis"]["anthropic_key"]), request)
+            raw_script = message.content[0].text.strip()
+            _store_cached_script(request, raw_script)
+        results[i] = _finish_summary(raw_script, request, stories_per_channel[i], configs[i], rng)
+
+    return results
+
+
+def _get_rng():
+    """Return this thread's random.Random, seeded from os.urandom."""
+    rng = getattr(_thread_local, "rng", None)
+    if rng is None:
+        rng = _thread_local.rng = random.Random(os.urandom(8))
+    return rng
+
+
+def _current_hour_label():
+    """Current hour as shown on air, e.g. '3 PM'."""
+    return datetime.now().strftime("%I %p").lstrip("0")
+
+
+def _summary_story_id(batch_seed=None, index=0):
+    """Story ID for a summary: seed + index within a batch, else a fresh UUID."""
+    if batch_seed is None:
+        return "hourly_" + uuid.uuid4().hex[:8]
+    return f"hourly_{batch_seed[:6]}_{index:02x}"
+
+
+def _prepare_summary_request(stories, config, world_bible, video_mode=False, rng=None,
+                             hour_label=None, story_id=None):
+    """
+    Pick the desk anchors and build the system message + prompt.
+
+    Returns a dict with anchor_a, anchor_b, solo_mode, system_msg, prompt,
+    story_count, hour_label, story_id and video_mode — everything needed to
+    call Claude and post-process its output.
+    """
+    rng = rng or _get_rng()
     all_anchors = world_bible.get("anchors", [])
     anchors = [a for a in all_anchors if not a.get("paused", False)]
     if not anchors:
@@ -65,13 +263,13 @@ def generate_hourly_summary(stories, config, world_bible, video_mode=False):
         males = [a for a in anchors if a.get("gender") == "male"]
         females = [a for a in anchors if a.get("gender") == "female"]
         if males and females:
-            anchor_a = random.choice(females)   # Female leads
-            anchor_b = random.choice(males)
+            anchor_a = rng.choice(females)   # Female leads
+            anchor_b = rng.choice(males)
             # Randomly swap who leads (50/50)
-            if random.random() < 0.5:
+            if rng.random() < 0.5:
                 anchor_a, anchor_b = anchor_b, anchor_a
         elif len(anchors) >= 2:
-            desk = random.sample(anchors, 2)
+            desk = rng.sample(anchors, 2)
             anchor_a = desk[0]
             anchor_b = desk[1]
         else:
@@ -84,12 +282,12 @@ def generate_hourly_summary(stories, config, world_bible, video_mode=False):
         headline = s.get("chyrons", ["Developing Story"])[0] if s.get("chyrons") else "Developing Story"
         # Strip tags from script for summary
         script = s.get("script", "")
-        clean = re.sub(r'\[[A-Z_-]+:\s*[^\]]+\]', '', script).strip()
+        clean = _TAG_STRIP.sub('', script).strip()
         story_briefs.append(f"- {headline}: {clean[:200]}")
 
     stories_block = "\n".join(story_briefs)
     story_count = len(story_briefs)
-    hour_label = datetime.now().strftime("%I %p").lstrip("0")
+    hour_label = hour_label or _current_hour_label()
 
     # Determine how many words based on story count
     # 3-4 stories = ~150 words, 5+ = ~200 words
@@ -161,14 +359,139 @@ Do NOT change the opening line. It MUST start with "Now on This News Now, I'm...
 
 Output ONLY the tagged script. No notes, no explanations."""
 
-    message = client.messages.create(
-        model="claude-sonnet-4-20250514",
-        max_tokens=1024,
-        system=system_msg,
-        messages=[{"role": "user", "content": prompt}],
-    )
+    return {
+        "anchor_a": anchor_a,
+        "anchor_b": anchor_b,
+        "solo_mode": solo_mode,
+        "system_msg": system_msg,
+        "prompt": prompt,
+        "story_count": story_count,
+        "hour_label": hour_label,
+        "story_id": story_id or _summary_story_id(),
+        "video_mode": video_mode,
+        "latency_mode": config.get("apis", {}).get("anthropic_latency_mode", "standard"),
+        "cache_ttl": config.get("cache", {}).get("hourly_ttl", DEFAULT_HOURLY_CACHE_TTL),
+    }
+
+
+def _message_params(request):
+    """Keyword arguments for messages.create() for a prepared summary request."""
+    return {
+        "model": SUMMARY_MODEL,
+        "max_tokens": 1024,
+        "system": request["system_msg"],
+        "messages": [{"role": "user", "content": request["prompt"]}],
+    }
+
+
+def _summary_cache_path(request):
+    """Content-addressed cache file for a prepared summary request."""
+    key = hashlib.blake2b(digest_size=16)
+    for part in (SUMMARY_MODEL, request["system_msg"], request["prompt"],
+                 request["anchor_a"]["name"], request["anchor_b"]["name"]):
+        key.update(part.encode("utf-8"))
+        key.update(b"\0")
+    return os.path.join(HOURLY_CACHE_DIR, f"{key.hexdigest()}.json")
+
+
+def _load_cached_script(request):
+    """Return a cached raw script for this exact request, or None."""
+    ttl = request.get("cache_ttl")
+    if not ttl:
+        return None
+    path = _summary_cache_path(request)
+    try:
+        with open(path, "r") as f:
+            entry = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if time.time() - entry.get("created", 0) > ttl:
+        _remove_quietly(path)
+        return None
+    print("  Hourly summary: cache hit, skipping Claude call")
+    return entry.get("raw_script")
+
+
+def _store_cached_script(request, raw_script):
+    """
+    Save a raw script under its request hash (best effort), first deleting
+    entries older than the TTL so the cache directory stays bounded.
+    """
+    ttl = request.get("cache_ttl")
+    if not ttl:
+        return
+    try:
+        os.makedirs(HOURLY_CACHE_DIR, exist_ok=True)
+        cutoff = time.time() - ttl
+        with os.scandir(HOURLY_CACHE_DIR) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.stat().st_mtime < cutoff:
+                    _remove_quietly(entry.path)
+        with open(_summary_cache_path(request), "w") as f:
+            json.dump({"created": time.time(), "raw_script": raw_script}, f)
+    except OSError:
+        pass
+
+
+def _remove_quietly(path):
+    """Delete path if it exists, ignoring errors."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _use_optimized_latency(request):
+    """Whether to request optimized-latency inference for this call."""
+    return (request.get("latency_mode") == "optimized"
+            and SUMMARY_MODEL not in _latency_unsupported)
+
+
+def _create_params(request):
+    """messages.create() kwargs, asking for optimized latency when enabled."""
+    params = _message_params(request)
+    if _use_optimized_latency(request):
+        params["extra_body"] = _OPTIMIZED_LATENCY
+    return params
+
+
+def _latency_fallback_params(error, request):
+    """
+    Handle a 400 from a _create_params() call: if it rejected the
+    optimized-latency performance_config, remember that for the model and
+    return standard-mode kwargs to retry with. Any other error is re-raised.
+    """
+    if "performance_config" not in f"{error} {getattr(error, 'body', '')}":
+        raise error
+    _latency_unsupported.add(SUMMARY_MODEL)
+    print(f"  WARNING: Optimized latency not supported for {SUMMARY_MODEL}, using standard")
+    return _message_params(request)
 
-    raw_script = message.content[0].text.strip()
+
+def _create_message(client, request):
+    """
+    Call messages.create() for a prepared request, asking for optimized
+    latency when enabled. Falls back to standard mode if the model rejects it.
+    """
+    try:
+        return client.messages.create(**_create_params(request))
+    except anthropic.BadRequestError as e:
+        return client.messages.create(**_latency_fallback_params(e, request))
+
+
+def _finish_summary(raw_script, request, stories, config, rng=None):
+    """
+    Post-process Claude's raw summary script into the final summary dict:
+    capitalization + real-name scrub, segment parsing, heavy nonsense on
+    one middle segment, and the sponsor read.
+    """
+    anchor_a = request["anchor_a"]
+    anchor_b = request["anchor_b"]
+    solo_mode = request["solo_mode"]
+    story_count = request["story_count"]
+    hour_label = request["hour_label"]
+    video_mode = request["video_mode"]
+    rng = rng or _get_rng()
 
     # Fix capitalization of acronyms and proper nouns
     from agents.writer import _fix_capitalization, _scrub_real_names
@@ -178,14 +501,16 @@ Output ONLY the tagged script. No notes, no explanations."""
     # Parse into segments
     segments = _parse_segments(raw_script, anchor_a["name"], anchor_b["name"])
 
-    # Apply heavy nonsense to one random segment (not the first/last)
-    from agents.nonsense import inject_heavy_nonsense
-    if len(segments) > 2:
+    # Apply heavy nonsense to one random segment (not the first/last).
+    # Skipped outright — no import, no model load — when nonsense is disabled.
+    nonsense_enabled = config.get("dials", {}).get("nonsense", {}).get("enabled", False)
+    if nonsense_enabled and len(segments) > 2:
+        from agents.nonsense import inject_heavy_nonsense
         # Pick a middle segment (not the opening or closing)
         nonsense_candidates = list(range(1, len(segments) - 1))
-        nonsense_idx = random.choice(nonsense_candidates)
+        nonsense_idx = rng.choice(nonsense_candidates)
         segments[nonsense_idx]["text"], sample = inject_heavy_nonsense(
-            segments[nonsense_idx]["text"], config, target_ratio=0.80
+            segments[nonsense_idx]["text"], config, target_ratio=0.80, rng=rng
         )
         print(f"  ★ Nonsense segment #{nonsense_idx + 1} — 80% Markov ('{sample}')")
 
@@ -208,7 +533,7 @@ Output ONLY the tagged script. No notes, no explanations."""
         if s.get("chyrons"):
             headlines.append(s["chyrons"][0])
 
-    story_id = "hourly_" + str(uuid.uuid4())[:8]
+    story_id = request["story_id"]
 
     result = {
         "segments": segments,
@@ -229,28 +554,19 @@ Output ONLY the tagged script. No notes, no explanations."""
 def _parse_segments(script, anchor_a_name, anchor_b_name):
     """Parse [ANCHOR_A]/[ANCHOR_B] tagged script into segments."""
     segments = []
-    # Split on anchor tags
-    parts = re.split(r'\[(ANCHOR_[AB])\]\s*', script)
-
-    current_anchor = None
-    for part in parts:
-        part = part.strip()
-        if not part:
-            continue
-        if part == "ANCHOR_A":
-            current_anchor = anchor_a_name
-        elif part == "ANCHOR_B":
-            current_anchor = anchor_b_name
-        elif current_anchor:
-            # Clean up any markdown
-            clean = re.sub(r'\*\*([^*]+)\*\*', r'\1', part)
-            clean = re.sub(r'\[CHYRON:\s*[^\]]+\]', '', clean)
-            clean = re.sub(r'\[B-ROLL:\s*[^\]]+\]', '', clean)
-            clean = clean.strip()
-            if clean:
-                segments.append({
-                    "anchor": current_anchor,
-                    "text": clean,
-                })
+    names = {"ANCHOR_A": anchor_a_name, "ANCHOR_B": anchor_b_name}
+
+    # Each tag's segment runs from the end of the tag to the start of the
+    # next one (or end of script); text before the first tag is dropped
+    tags = list(_ANCHOR_TAG.finditer(script))
+    for i, tag in enumerate(tags):
+        end = tags[i + 1].start() if i + 1 < len(tags) else len(script)
+        # Clean up any markdown and inline tags
+        clean = _SEGMENT_CLEAN.sub(r'\1', script[tag.end():end]).strip()
+        if clean:
+            segments.append({
+                "anchor": names[tag.group(1)],
+                "text": clean,
+            })
 
     return segments
@@ -6,10 +6,36 @@ using story context (headline, topic, B-roll descriptions) as prompts.
 """
 
 import base64
+import hashlib
 import os
 import re
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+
+from agents.fileutil import link_or_copy
+
+# Shared keep-alive session: reuses TCP/TLS connections to the OpenAI API
+# and image CDN across stories instead of a fresh handshake per call.
+_SESSION = requests.Session()
+_SESSION.headers.update({"Content-Type": "application/json"})
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# Generated images keyed by a hash of (prompt, model, size, quality), so an
+# identical prompt is served from disk instead of a new paid generation.
+# Opt-in (config: images.cache), since entries are never evicted.
+IMAGE_CACHE_DIR = Path(os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "cache", "images"
+))
+
+# Download / base64-decode chunk size (a multiple of 4 so base64 slices
+# decode independently)
+_CHUNK_SIZE = 64 * 1024
+
+# Inline [CHYRON: ...] / [B-ROLL: ...] tags
+_TAG_STRIP = re.compile(r'\[[A-Z_-]+:\s*[^\]]+\]')
 
 
 def generate_story_image(script_data, config):
@@ -34,18 +60,33 @@ def generate_story_image(script_data, config):
     model = image_config.get("model", "gpt-image-1")
     quality = image_config.get("quality", "medium")
     size = image_config.get("size", "1024x1024")
+    use_cache = image_config.get("cache", False)
 
     # Build the image prompt from story data
     prompt = _build_image_prompt(script_data, config)
     story_id = script_data.get("story_id", "unknown")
 
+    output_dir = Path("docs") / "images"
+    output_dir.mkdir(exist_ok=True)
+    image_path = output_dir / f"{story_id}.jpg"
+
+    # Identical prompt already generated? Reuse it.
+    cache_key = hashlib.blake2b(
+        "\0".join((prompt, model, size, quality)).encode("utf-8"), digest_size=8
+    ).hexdigest()
+    cache_path = IMAGE_CACHE_DIR / f"{cache_key}.jpg"
+    if use_cache and cache_path.exists() and link_or_copy(cache_path, image_path):
+        print(f"  Image reused from cache: {image_path.name}")
+        return {
+            "image_path": str(image_path),
+            "story_id": story_id,
+        }
+
+    part_path = f"{image_path}.part"
     try:
-        response = requests.post(
+        response = _SESSION.post(
             "https://api.openai.com/v1/images/generations",
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            },
+            headers={"Authorization": f"Bearer {api_key}"},
             json={
                 "model": model,
                 "prompt": prompt,
@@ -60,23 +101,26 @@ def generate_story_image(script_data, config):
 
         image_data = data["data"][0]
 
-        # Save the image
-        output_dir = Path("docs") / "images"
-        output_dir.mkdir(exist_ok=True)
-        image_path = output_dir / f"{story_id}.jpg"
-
+        # Save the image via a .part file renamed into place, so a failed
+        # download never leaves a truncated jpg (and the rename replaces,
+        # rather than overwrites, a file hard-linked into the image cache)
         if "b64_json" in image_data:
-            img_bytes = base64.b64decode(image_data["b64_json"])
-            with open(image_path, "wb") as f:
-                f.write(img_bytes)
+            with open(part_path, "wb") as f:
+                _write_b64(image_data["b64_json"], f)
         elif "url" in image_data:
-            img_resp = requests.get(image_data["url"], timeout=60)
-            img_resp.raise_for_status()
-            with open(image_path, "wb") as f:
-                f.write(img_resp.content)
+            with _SESSION.get(image_data["url"], timeout=60, stream=True) as img_resp:
+                img_resp.raise_for_status()
+                with open(part_path, "wb") as f:
+                    for chunk in img_resp.iter_content(chunk_size=_CHUNK_SIZE):
+                        f.write(chunk)
         else:
             print(f"  WARNING: No image data in response for {story_id}")
             return None
+        os.replace(part_path, image_path)
+
+        if use_cache:
+            IMAGE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            link_or_copy(image_path, cache_path)
 
         print(f"  Image generated: {image_path.name}")
         return {
@@ -95,6 +139,44 @@ def generate_story_image(script_data, config):
     except (KeyError, IndexError) as e:
         print(f"  WARNING: Unexpected image API response for {story_id}: {e}")
         return None
+    finally:
+        if os.path.lexists(part_path):
+            try:
+                os.remove(part_path)
+            except OSError:
+                pass
+
+
+def generate_story_images(stories, config, max_workers=4):
+    """
+    Generate header images for several stories concurrently.
+
+    Image generation is dominated by waiting on the OpenAI API, so the
+    requests (and their downloads/disk writes) are overlapped on a thread
+    pool instead of running back to back.
+
+    Returns a dict mapping story_id → generate_story_image() result
+    (None where generation failed).
+    """
+    if not stories:
+        return {}
+
+    def _generate(script_data):
+        try:
+            return generate_story_image(script_data, config)
+        except Exception as e:
+            print(f"  WARNING: Image generation error for {script_data.get('story_id', 'unknown')}: {e}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(stories))) as pool:
+        results = pool.map(_generate, stories)
+        return {s.get("story_id", "unknown"): r for s, r in zip(stories, results)}
+
+
+def _write_b64(b64_text, f):
+    """Decode base64 text into file f chunk by chunk (no full decoded copy in memory)."""
+    for i in range(0, len(b64_text), _CHUNK_SIZE):
+        f.write(base64.b64decode(b64_text[i:i + _CHUNK_SIZE]))
 
 
 def _build_image_prompt(script_data, config):
@@ -111,7 +193,7 @@ def _build_image_prompt(script_data, config):
 
     # Clean script for context (strip tags)
     script = script_data.get("script", "")
-    clean_script = re.sub(r'\[[A-Z_-]+:\s*[^\]]+\]', '', script).strip()
+    clean_script = _TAG_STRIP.sub('', script).strip()
 
     # Build prompt parts
     parts = []
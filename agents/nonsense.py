@@ -16,113 +16,213 @@ Settings (config.yaml → dials.nonsense):
 """
 
 import json
-import math
 import os
+import pickle
 import random
 import re
+import tempfile
+import threading
 
 _model = None
 _model_path = os.path.join(os.path.dirname(__file__), "markov_model.json")
 
+# Sampling-ready copy of the model, rebuilt whenever the JSON is newer.
+# Bump _MODEL_FORMAT when the in-memory layout changes.
+_model_cache_path = os.path.join(os.path.dirname(__file__), "markov_model.pkl")
+_MODEL_FORMAT = 4
+
+# Per-thread RNGs (see _get_rng) so concurrent generators don't share state
+_thread_local = threading.local()
+
+# Script tokens: a whole [TAG: ...] block, or a single word
+_TAG_OR_WORD = re.compile(r'\[[A-Z_-]+:\s*[^\]]+\]|\S+')
+
+# Contractions split apart during original tokenization (lowercase keys)
+_CONTRACTION_MAP = {
+    "i m": "i'm",
+    "don t": "don't",
+    "can t": "can't",
+    "won t": "won't",
+    "doesn t": "doesn't",
+    "isn t": "isn't",
+    "didn t": "didn't",
+    "wasn t": "wasn't",
+    "aren t": "aren't",
+    "weren t": "weren't",
+    "shouldn t": "shouldn't",
+    "couldn t": "couldn't",
+    "wouldn t": "wouldn't",
+    "i ve": "i've",
+    "i ll": "i'll",
+    "i d": "i'd",
+    "we re": "we're",
+    "they re": "they're",
+    "you re": "you're",
+    "it s": "it's",
+    "that s": "that's",
+    "what s": "what's",
+    "there s": "there's",
+    "here s": "here's",
+}
+_CONTRACTION_RE = re.compile(
+    r'\b(' + '|'.join(map(re.escape, _CONTRACTION_MAP)) + r')\b', re.IGNORECASE
+)
+
+
+def _get_rng():
+    """Return this thread's random.Random, seeded from os.urandom."""
+    rng = getattr(_thread_local, "rng", None)
+    if rng is None:
+        rng = _thread_local.rng = random.Random(os.urandom(8))
+    return rng
+
 
 def _load_model():
-    """Lazy-load the Markov chain model."""
+    """
+    Lazy-load the Markov chain model.
+
+    Transition lists ([[word, freq], ...]) are converted once into
+    (words, weights, alias_table, tempered) entries so each draw is O(1)
+    (Vose alias method) instead of a Python scan. The converted model is
+    pickled next to the JSON and reused on later process starts while it
+    is newer than the JSON.
+    """
     global _model
     if _model is None:
-        with open(_model_path) as f:
-            _model = json.load(f)
+        _model = _load_cached_model()
+        if _model is None:
+            _model = _build_sampling_model(_read_model_json())
+            _save_cached_model(_model)
     return _model
 
 
-def _pick_from_options(options, temperature=1.0):
-    """Pick a word from [word, frequency] pairs with temperature sampling."""
+def _read_model_json():
+    """Parse the raw JSON model, using orjson when installed (cold start only)."""
+    with open(_model_path, "rb") as f:
+        data = f.read()
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+def _build_sampling_model(raw):
+    """Convert the raw JSON model into the sampling-ready layout."""
+    def entry(words, weights):
+        # tempered: {temperature: alias_table}, filled lazily by _pick_from_options
+        return tuple(words), tuple(weights), _alias_table(weights), {}
+
+    return {
+        "c1": {k: entry([o[0] for o in v], [o[1] for o in v]) for k, v in raw["c1"].items()},
+        # Bigram keys "w1|w2" become (w1, w2) tuples — no string building per step
+        "c2": {tuple(k.split("|")): entry([o[0] for o in v], [o[1] for o in v])
+               for k, v in raw["c2"].items()},
+        "s": entry([tuple(pair) for pair in raw["s"]], raw["sw"]),
+    }
+
+
+def _alias_table(weights):
+    """
+    Build a Vose alias table (prob, alias) for O(1) weighted sampling:
+    pick a column i uniformly, keep i with probability prob[i], else take alias[i].
+    """
+    n = len(weights)
+    total = sum(weights)
+    scaled = [w * n / total for w in weights]
+    prob = [1.0] * n
+    alias = list(range(n))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        lo = small.pop()
+        hi = large.pop()
+        prob[lo] = scaled[lo]
+        alias[lo] = hi
+        scaled[hi] += scaled[lo] - 1.0
+        (small if scaled[hi] < 1.0 else large).append(hi)
+    # Anything left over is (up to rounding) exactly full: prob stays 1.0
+    return tuple(prob), tuple(alias)
+
+
+def _load_cached_model():
+    """Return the pickled sampling model, or None if missing or stale."""
+    try:
+        if os.path.getmtime(_model_cache_path) < os.path.getmtime(_model_path):
+            return None
+        with open(_model_cache_path, "rb") as f:
+            cached = pickle.load(f)
+    except Exception:  # unreadable, truncated or foreign pickle: rebuild
+        return None
+    if not isinstance(cached, dict) or cached.get("format") != _MODEL_FORMAT:
+        return None
+    return cached["model"]
+
+
+def _save_cached_model(model):
+    """Pickle the sampling model next to the JSON (best effort)."""
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(_model_cache_path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump({"format": _MODEL_FORMAT, "model": model}, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, _model_cache_path)
+    except OSError:
+        pass
+
+
+def _pick_from_options(options, temperature=1.0, rng=None):
+    """
+    Pick from a (words, weights, alias_table, tempered) entry with
+    temperature sampling in O(1). Alias tables for tempered weights are
+    built once per entry and temperature, then reused (temperature is a
+    fixed config dial).
+    """
     if not options:
         return None
-    if temperature == 1.0:
-        weights = [o[1] for o in options]
-    else:
-        weights = [math.pow(o[1], 1.0 / temperature) for o in options]
-    total = sum(weights)
-    r = random.random() * total
-    for i, w in enumerate(weights):
-        r -= w
-        if r <= 0:
-            return options[i][0]
-    return options[-1][0]
-
-
-def _pick_weighted(items, weights, temperature=1.0):
-    """Pick from items list using weight list with temperature."""
-    if temperature == 1.0:
-        adj = list(weights)
-    else:
-        adj = [math.pow(w, 1.0 / temperature) for w in weights]
-    total = sum(adj)
-    r = random.random() * total
-    for i, w in enumerate(adj):
-        r -= w
-        if r <= 0:
-            return items[i]
-    return items[-1]
+    words, weights, table, tempered = options
+    if len(words) == 1:
+        return words[0]
+    if temperature != 1.0:
+        table = tempered.get(temperature)
+        if table is None:
+            exponent = 1.0 / temperature
+            table = tempered[temperature] = _alias_table([w ** exponent for w in weights])
+    prob, alias = table
+    # One uniform draw: integer part picks the column, fraction is the coin
+    u = (rng or _get_rng()).random() * len(words)
+    i = int(u)
+    return words[i] if u - i < prob[i] else words[alias[i]]
 
 
 def _fix_contractions(text):
     """Rejoin contractions that were split during original tokenization."""
-    fixes = [
-        (r"\bi m\b", "i'm"),
-        (r"\bdon t\b", "don't"),
-        (r"\bcan t\b", "can't"),
-        (r"\bwon t\b", "won't"),
-        (r"\bdoesn t\b", "doesn't"),
-        (r"\bisn t\b", "isn't"),
-        (r"\bdidn t\b", "didn't"),
-        (r"\bwasn t\b", "wasn't"),
-        (r"\baren t\b", "aren't"),
-        (r"\bweren t\b", "weren't"),
-        (r"\bshouldn t\b", "shouldn't"),
-        (r"\bcouldn t\b", "couldn't"),
-        (r"\bwouldn t\b", "wouldn't"),
-        (r"\bi ve\b", "i've"),
-        (r"\bi ll\b", "i'll"),
-        (r"\bi d\b", "i'd"),
-        (r"\bwe re\b", "we're"),
-        (r"\bthey re\b", "they're"),
-        (r"\byou re\b", "you're"),
-        (r"\bit s\b", "it's"),
-        (r"\bthat s\b", "that's"),
-        (r"\bwhat s\b", "what's"),
-        (r"\bthere s\b", "there's"),
-        (r"\bhere s\b", "here's"),
-    ]
-    for pattern, replacement in fixes:
-        text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
-    return text
-
-
-def generate_fragment(min_words=2, max_words=4, temperature=1.0):
+    return _CONTRACTION_RE.sub(lambda m: _CONTRACTION_MAP[m.group(1).lower()], text)
+
+
+def generate_fragment(min_words=2, max_words=4, temperature=1.0, rng=None):
     """
     Generate a short Markov chain word fragment.
     Returns a lowercase string of 2-4 words with no end punctuation.
+
+    rng: optional random.Random (defaults to a per-thread instance)
     """
+    rng = rng or _get_rng()
     model = _load_model()
-    target_len = random.randint(min_words, max_words)
+    target_len = rng.randint(min_words, max_words)
 
     # Pick a weighted-random starter pair
-    starters = model["s"]
-    starter_weights = model["sw"]
-    starter = _pick_weighted(starters, starter_weights, temperature)
+    starter = _pick_from_options(model["s"], temperature, rng)
 
     words = list(starter)
+    c1 = model["c1"]
+    c2 = model["c2"]
 
-    # Extend with chain lookups
+    # Extend with chain lookups (bigram first, then unigram)
     for _ in range(target_len - len(words)):
-        key2 = f"{words[-2]}|{words[-1]}" if len(words) >= 2 else None
-        next_word = None
-
-        if key2 and key2 in model["c2"]:
-            next_word = _pick_from_options(model["c2"][key2], temperature)
-        elif words[-1] in model["c1"]:
-            next_word = _pick_from_options(model["c1"][words[-1]], temperature)
+        options = c2.get((words[-2], words[-1])) if len(words) >= 2 else None
+        if options is None:
+            options = c1.get(words[-1])
+        next_word = _pick_from_options(options, temperature, rng)
 
         if not next_word:
             break
@@ -139,7 +239,7 @@ def generate_fragment(min_words=2, max_words=4, temperature=1.0):
     return fragment
 
 
-def inject_nonsense(script_text, config):
+def inject_nonsense(script_text, config, rng=None):
     """
     Possibly inject a nonsense fragment into a news script.
 
@@ -147,9 +247,12 @@ def inject_nonsense(script_text, config):
     Replaces N consecutive spoken words with N Markov-generated words
     so word count is preserved.
 
+    rng: optional random.Random (defaults to a per-thread instance)
+
     Returns:
         (modified_script, injected: bool, fragment: str or None)
     """
+    rng = rng or _get_rng()
     settings = config.get("dials", {}).get("nonsense", {})
 
     if not settings.get("enabled", False):
@@ -158,7 +261,7 @@ def inject_nonsense(script_text, config):
     chance = settings.get("injection_chance", 0.15)
 
     # Roll the dice for this story
-    if random.random() > chance:
+    if rng.random() > chance:
         return script_text, False, None
 
     min_frag = settings.get("min_fragment", 2)
@@ -166,40 +269,43 @@ def inject_nonsense(script_text, config):
     temperature = settings.get("temperature", 1.0)
 
     # Generate the fragment
-    fragment = generate_fragment(min_frag, max_frag, temperature)
+    fragment = generate_fragment(min_frag, max_frag, temperature, rng)
     frag_words = fragment.split()
     frag_len = len(frag_words)
 
-    # Tokenise script, keeping [TAG: ...] blocks as single tokens
-    tokens = re.findall(r'\[[A-Z_-]+:\s*[^\]]+\]|\S+', script_text)
-
-    # Identify indices of spoken (non-tag) tokens
-    spoken_idx = [i for i, t in enumerate(tokens) if not t.startswith('[')]
+    # Single scan: record (start, end) spans of spoken (non-tag) tokens,
+    # keeping [TAG: ...] blocks as single tokens
+    spoken_spans = [m.span() for m in _TAG_OR_WORD.finditer(script_text)
+                    if not m.group().startswith('[')]
 
     # Must have enough room: skip first 6 and last 6 spoken words
     margin = 6
-    if len(spoken_idx) < margin * 2 + frag_len:
+    if len(spoken_spans) < margin * 2 + frag_len:
         return script_text, False, None
 
     # Eligible injection zone
     lo = margin
-    hi = len(spoken_idx) - margin - frag_len
+    hi = len(spoken_spans) - margin - frag_len
     if hi <= lo:
         return script_text, False, None
 
-    inject_at = random.randint(lo, hi)
+    inject_at = rng.randint(lo, hi)
 
-    # Replace frag_len spoken words starting at inject_at
-    positions = spoken_idx[inject_at : inject_at + frag_len]
-    for j, pos in enumerate(positions):
-        if j < len(frag_words):
-            tokens[pos] = frag_words[j]
+    # Splice the fragment over frag_len spoken words starting at inject_at,
+    # leaving the rest of the script (tags, whitespace) untouched
+    pieces = []
+    prev_end = 0
+    for (start, end), word in zip(spoken_spans[inject_at : inject_at + frag_len], frag_words):
+        pieces.append(script_text[prev_end:start])
+        pieces.append(word)
+        prev_end = end
+    pieces.append(script_text[prev_end:])
 
-    modified = " ".join(tokens)
+    modified = "".join(pieces)
     return modified, True, fragment
 
 
-def inject_heavy_nonsense(script_text, config, target_ratio=0.80):
+def inject_heavy_nonsense(script_text, config, target_ratio=0.80, rng=None):
     """
     Replace ~80% of spoken words with Markov chain output.
     Used for the one standout nonsense story per batch.
@@ -207,14 +313,17 @@ def inject_heavy_nonsense(script_text, config, target_ratio=0.80):
     Keeps [TAG: ...] blocks intact and preserves the first ~3 and last ~3
     spoken words so the opening/closing still sound vaguely like news.
 
+    rng: optional random.Random (defaults to a per-thread instance)
+
     Returns:
         (modified_script, fragment_summary: str)
     """
+    rng = rng or _get_rng()
     settings = config.get("dials", {}).get("nonsense", {})
     temperature = settings.get("temperature", 1.2)
 
     # Tokenise, keeping [TAG: ...] blocks as single tokens
-    tokens = re.findall(r'\[[A-Z_-]+:\s*[^\]]+\]|\S+', script_text)
+    tokens = _TAG_OR_WORD.findall(script_text)
     spoken_idx = [i for i, t in enumerate(tokens) if not t.startswith('[')]
 
     if len(spoken_idx) < 10:
@@ -226,14 +335,14 @@ def inject_heavy_nonsense(script_text, config, target_ratio=0.80):
 
     # Pick ~80% of replaceable positions at random
     n_replace = max(1, int(len(replaceable) * target_ratio))
-    positions_to_replace = sorted(random.sample(replaceable, min(n_replace, len(replaceable))))
+    positions_to_replace = sorted(rng.sample(replaceable, min(n_replace, len(replaceable))))
 
     # Generate a long Markov chain to pull words from
     model = _load_model()
     chain_words = []
     # Generate enough words in consecutive fragments
     while len(chain_words) < n_replace + 10:
-        frag = generate_fragment(min_words=3, max_words=6, temperature=temperature)
+        frag = generate_fragment(min_words=3, max_words=6, temperature=temperature, rng=rng)
         chain_words.extend(frag.split())
 
     # Replace spoken words at selected positions
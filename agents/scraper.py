@@ -9,10 +9,29 @@ all proper names of people and companies. The writer uses these blueprints
 to craft parallel-universe stories that feel reality-adjacent.
 """
 
+import atexit
+import copy
 import feedparser
+import functools
+import hashlib
+import itertools
+import json
+import os
+import pickle
 import re
+import tempfile
 import requests
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+
+# lxml-backed parser, much faster than feedparser's pure-Python XML handling.
+# Optional: feedparser is used when it isn't installed or can't parse a feed.
+try:
+    import fastfeedparser
+except ImportError:
+    fastfeedparser = None
 
 
 # Major RSS feeds for broad, current coverage
@@ -26,6 +45,27 @@ RSS_FEEDS = [
     ("NY Times", "https://rss.nytimes.com/services/xml/rss/nyt/HomePage.xml"),
 ]
 
+# Shared keep-alive session so feed fetches reuse pooled TCP/TLS connections
+# across scrapes: one pool per feed host, closed when the process exits
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": "ThisNewsNow/1.0 (RSS Reader)"})
+_SESSION.mount("https://", HTTPAdapter(pool_connections=len(RSS_FEEDS), pool_maxsize=2))
+atexit.register(_SESSION.close)
+
+# Per-feed ETag / Last-Modified validators plus the stories parsed from the
+# last full response, so an unchanged feed (HTTP 304) is neither downloaded
+# nor re-parsed: {url: {"etag": ..., "modified": ..., "stories": [...]}}
+FEED_STATE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "cache", "feed_state.json"
+)
+_FEED_STATE = None
+
+# Recent scrape_news_context results keyed by a digest of the scraped
+# stories (see _context_cache_key), least recently used first
+_CONTEXT_CACHE = OrderedDict()
+_CONTEXT_CACHE_SIZE = 8
+
 
 # ── Topic keyword maps ──
 TOPIC_KEYWORDS = {
@@ -99,10 +139,60 @@ FRAMING_PATTERNS = {
     "development": ["reports", "says", "plans", "considers", "moves to", "seeks", "looks at"],
 }
 
+# Register heuristic word lists
+URGENT_WORDS = ["breaking", "emergency", "crisis", "killed", "shooting",
+                "attack", "war", "collapse", "explosion", "evacuate"]
+CALM_WORDS = ["announces", "plans", "report", "study", "expected",
+              "scheduled", "opens", "celebrates", "approves"]
+
+# Every distinct topic/conflict keyword → the histogram slots it
+# feeds. Some keywords appear in both tables (e.g. "shooting", "outbreak"),
+# so each is counted once and the count credited to every target.
+def _build_keyword_index(*tables):
+    """
+    Map each keyword to the histogram slots whose keyword lists contain it.
+    Slots number every category of every table in order (topics first, then
+    conflict types), so tallies go into one flat list of counts.
+    Keys are bytes: keyword tallies run bytes.count over the encoded scrape text.
+    """
+    index = {}
+    slot = 0
+    for patterns in tables:
+        for keywords in patterns.values():
+            for kw in keywords:
+                index.setdefault(kw.encode(), []).append(slot)
+            slot += 1
+    return index
+
+
+_KEYWORD_INDEX = _build_keyword_index(TOPIC_KEYWORDS, CONFLICT_PATTERNS)
+
 # ── Known names for anonymization (imported from writer at runtime) ──
 _PEOPLE_ROLES = None
 _COMPANY_SECTORS = None
 
+# Built by _load_name_maps: one alternation over both maps (longest names
+# first; companies whole-word only) plus lowercase lookups back to the
+# replacement text. _NAME_RE holds lowercase keys and is run against
+# text.lower() — case-sensitive matching is much faster than IGNORECASE.
+# _NAME_RE_IGNORECASE covers the rare text whose length changes when
+# lowercased (so offsets wouldn't line up).
+_NAME_RE = None
+_NAME_RE_IGNORECASE = None
+_PEOPLE_ROLES_CI = {}
+_COMPANY_SECTORS_CI = {}
+
+# Built role/sector maps cached across process starts, so a warm start does
+# not import agents.writer (and its API client) just to anonymize headlines.
+# Invalidated when writer.py changes; bump _NAME_MAP_CACHE_VERSION when the
+# role/sector mapping rules below change.
+NAME_MAP_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "cache", "scraper_name_maps.pkl"
+)
+_NAME_MAP_CACHE_VERSION = 1
+_WRITER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "writer.py")
+
 
 def _load_name_maps():
     """Lazily load name maps from writer module for anonymization."""
@@ -110,11 +200,18 @@ def _load_name_maps():
     if _PEOPLE_ROLES is not None:
         return
 
+    cached = _load_cached_name_maps()
+    if cached is not None:
+        _PEOPLE_ROLES, _COMPANY_SECTORS = cached
+        _compile_name_patterns()
+        return
+
     try:
         from agents.writer import _REAL_PEOPLE_MAP, _REAL_COMPANIES_MAP
     except ImportError:
         _PEOPLE_ROLES = {}
         _COMPANY_SECTORS = {}
+        _compile_name_patterns()
         return
 
     # Map real people to role descriptions
@@ -170,6 +267,77 @@ def _load_name_maps():
         if co not in _COMPANY_SECTORS:
             _COMPANY_SECTORS[co] = "a major corporation"
 
+    _compile_name_patterns()
+    _save_cached_name_maps()
+
+
+def _name_map_cache_key():
+    """Cache key: format version plus writer.py's mtime and size (None if missing)."""
+    try:
+        st = os.stat(_WRITER_PATH)
+    except OSError:
+        return None
+    return (_NAME_MAP_CACHE_VERSION, st.st_mtime_ns, st.st_size)
+
+
+def _load_cached_name_maps():
+    """Return the cached (people_roles, company_sectors), or None if missing or stale."""
+    key = _name_map_cache_key()
+    if key is None:
+        return None
+    try:
+        with open(NAME_MAP_CACHE_PATH, "rb") as f:
+            cached = pickle.load(f)
+    except Exception:  # unreadable, truncated or foreign pickle: rebuild
+        return None
+    if not isinstance(cached, dict) or cached.get("key") != key:
+        return None
+    return cached["people_roles"], cached["company_sectors"]
+
+
+def _save_cached_name_maps():
+    """Pickle the built name maps (best effort)."""
+    key = _name_map_cache_key()
+    if key is None:
+        return
+    try:
+        os.makedirs(os.path.dirname(NAME_MAP_CACHE_PATH), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(NAME_MAP_CACHE_PATH), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump({"key": key, "people_roles": _PEOPLE_ROLES,
+                         "company_sectors": _COMPANY_SECTORS}, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, NAME_MAP_CACHE_PATH)
+    except OSError:
+        pass
+
+
+def _compile_name_patterns():
+    """Compile the people/company maps into one single-scan pattern for _anonymize_text."""
+    global _NAME_RE, _NAME_RE_IGNORECASE, _PEOPLE_ROLES_CI, _COMPANY_SECTORS_CI
+    _PEOPLE_ROLES_CI = {name.lower(): role for name, role in _PEOPLE_ROLES.items()}
+    _COMPANY_SECTORS_CI = {co.lower(): sector for co, sector in _COMPANY_SECTORS.items()}
+    # Cached results were computed against the previous maps
+    _anonymize_text.cache_clear()
+
+    # People first, so a person wins over a company starting at the same spot
+    branches = []
+    if _PEOPLE_ROLES_CI:
+        branches.append("(?P<person>" + "|".join(
+            re.escape(n) for n in sorted(_PEOPLE_ROLES_CI, key=len, reverse=True)) + ")")
+    if _COMPANY_SECTORS_CI:
+        branches.append(r"\b(?P<company>" + "|".join(
+            re.escape(c) for c in sorted(_COMPANY_SECTORS_CI, key=len, reverse=True)) + r")\b")
+    pattern = "|".join(branches)
+    _NAME_RE = re.compile(pattern) if branches else None
+    _NAME_RE_IGNORECASE = re.compile(pattern, re.IGNORECASE) if branches else None
+
+
+def _replace_known_name(match):
+    """Role/sector description for a _NAME_RE match."""
+    if match.lastgroup == "person":
+        return _PEOPLE_ROLES_CI[match.group(0).lower()]
+    return _COMPANY_SECTORS_CI[match.group(0).lower()]
+
 
 def scrape_news_context():
     """
@@ -181,40 +349,82 @@ def scrape_news_context():
 
     Returns a dict consumed by the writer agent.
     """
-    stories_raw = []
+    _load_feed_state()
+
+    # Fetch all feeds concurrently (IO-bound), then merge in RSS_FEEDS order
+    # so results don't depend on which feed answered first
+    feed_stories = [[] for _ in RSS_FEEDS]
+    with ThreadPoolExecutor(max_workers=len(RSS_FEEDS)) as pool:
+        futures = {
+            pool.submit(_fetch_one, source_name, feed_url): i
+            for i, (source_name, feed_url) in enumerate(RSS_FEEDS)
+        }
+        for future in as_completed(futures):
+            feed_stories[futures[future]] = future.result()
+    stories_raw = [story for stories in feed_stories for story in stories]
+    _save_feed_state()
+
+    # Identical feed content (e.g. back-to-back runs) → reuse the analysis
+    cache_key = _context_cache_key(stories_raw)
+    cached = _CONTEXT_CACHE.get(cache_key)
+    if cached is not None:
+        _CONTEXT_CACHE.move_to_end(cache_key)
+        context = copy.deepcopy(cached)
+        context["timestamp"] = datetime.now().isoformat()
+    else:
+        context = _build_context(stories_raw)
+        _CONTEXT_CACHE[cache_key] = copy.deepcopy(context)
+        while len(_CONTEXT_CACHE) > _CONTEXT_CACHE_SIZE:
+            _CONTEXT_CACHE.popitem(last=False)
+
+    register = context["register"]
+    blueprints = context["story_blueprints"]
+    print(f"  Scraped {context['headline_count']} headlines. Register: {register}. "
+          f"Topics: {context['trending_topics']}. Conflicts: {context['conflict_types']}")
+    print(f"  Story blueprints: {len(blueprints)} extracted")
+
+    # ── Update style library if available ──
+    try:
+        from agents.style_memory import load_style_library, update_from_scrape, save_style_library
+        library = load_style_library()
+        library = update_from_scrape(library, blueprints, register, context["topic_counts"])
+        save_style_library(library)
+        print(f"  Style library updated: {library.get('total_scrapes', 0)} total scrapes, "
+              f"{len(library.get('headline_templates', []))} templates")
+    except Exception as e:
+        print(f"  Warning: Could not update style library: {e}")
+
+    return context
+
+
+def _context_cache_key(stories_raw):
+    """Digest of the ordered (source, title, summary) of every scraped story."""
+    h = hashlib.blake2b(digest_size=16)
+    for s in stories_raw:
+        h.update("\0".join((s["source"], s["title"], s["summary"])).encode("utf-8", "replace"))
+        h.update(b"\1")
+    return h.digest()
 
-    for source_name, feed_url in RSS_FEEDS:
-        try:
-            resp = requests.get(feed_url, timeout=10, headers={
-                "User-Agent": "ThisNewsNow/1.0 (RSS Reader)"
-            })
-            resp.raise_for_status()
-            feed = feedparser.parse(resp.content)
-            for entry in feed.entries[:18]:
-                title = entry.get("title", "").strip()
-                summary = ""
-                if entry.get("summary"):
-                    summary = _clean_html(entry["summary"])[:400]
-                elif entry.get("description"):
-                    summary = _clean_html(entry["description"])[:400]
-
-                if title:
-                    stories_raw.append({
-                        "source": source_name,
-                        "title": title,
-                        "summary": summary,
-                    })
-        except Exception as e:
-            print(f"  Warning: Could not fetch {source_name}: {e}")
 
+def _build_context(stories_raw):
+    """Run the keyword, register and blueprint analysis over the scraped stories."""
     headlines = [s["title"] for s in stories_raw]
-    all_text = " ".join(headlines + [s["summary"] for s in stories_raw]).lower()
+    all_text = " ".join(itertools.chain(headlines, (s["summary"] for s in stories_raw))).lower()
+
+    # ── Topic + conflict histograms ──
+    # One count per distinct keyword, credited to each histogram slot it feeds
+    counts = [0] * (len(TOPIC_KEYWORDS) + len(CONFLICT_PATTERNS))
+    # Keywords are ASCII, so counts over UTF-8 bytes match the str counts
+    all_text_bytes = all_text.encode("utf-8", "replace")
+    for kw, slots in _KEYWORD_INDEX.items():
+        count = all_text_bytes.count(kw)
+        if count:
+            for slot in slots:
+                counts[slot] += count
+    topic_counts = dict(zip(TOPIC_KEYWORDS, counts))
+    conflict_scores = dict(zip(CONFLICT_PATTERNS, counts[len(TOPIC_KEYWORDS):]))
 
     # ── Classify topics ──
-    topic_counts = {t: 0 for t in TOPIC_KEYWORDS}
-    for topic, keywords in TOPIC_KEYWORDS.items():
-        for kw in keywords:
-            topic_counts[topic] += all_text.count(kw)
 
     sorted_topics = sorted(topic_counts.items(), key=lambda x: x[1], reverse=True)
     trending = [t[0] for t in sorted_topics[:4] if t[1] > 0]
@@ -222,23 +432,16 @@ def scrape_news_context():
         trending = ["politics", "economy", "infrastructure"]
 
     # ── Detect active conflict types ──
-    active_conflicts = []
-    for ctype, keywords in CONFLICT_PATTERNS.items():
-        score = sum(all_text.count(kw) for kw in keywords)
-        if score > 0:
-            active_conflicts.append((ctype, score))
+    active_conflicts = [(ctype, score) for ctype, score in conflict_scores.items() if score > 0]
     active_conflicts.sort(key=lambda x: x[1], reverse=True)
     conflict_types = [c[0] for c in active_conflicts[:3]]
     if not conflict_types:
         conflict_types = ["development", "investigation"]
 
     # ── Register heuristic ──
-    urgent_words = ["breaking", "emergency", "crisis", "killed", "shooting",
-                     "attack", "war", "collapse", "explosion", "evacuate"]
-    calm_words = ["announces", "plans", "report", "study", "expected",
-                   "scheduled", "opens", "celebrates", "approves"]
-    urgent_count = sum(1 for w in urgent_words if w in all_text)
-    calm_count = sum(1 for w in calm_words if w in all_text)
+    # (substring presence, so "attack" also counts "attacks"/"attacked")
+    urgent_count = sum(1 for w in URGENT_WORDS if w in all_text)
+    calm_count = sum(1 for w in CALM_WORDS if w in all_text)
 
     if urgent_count > 5:
         register = "chaotic"
@@ -250,7 +453,8 @@ def scrape_news_context():
         register = "tense"
 
     # ── Build story blueprints ──
-    blueprints = _extract_story_blueprints(stories_raw[:40])
+    # Cross-posted wire stories share a headline; drop exact repeats first
+    blueprints = _extract_story_blueprints(_dedupe_by_title(stories_raw)[:40])
 
     # Backward-compat: also provide flat story_shapes
     story_shapes = [bp["headline_frame"] for bp in blueprints]
@@ -259,11 +463,12 @@ def scrape_news_context():
     formats = ["anchor_read"]
     if urgent_count > 2:
         formats.append("breaking")
-    if any("investigation" in s["title"].lower() or "probe" in s["title"].lower()
-           for s in stories_raw):
+    # Headlines only (not summaries); newline-joined so no keyword can
+    # match across two titles
+    headline_text = "\n".join(headlines).lower()
+    if "investigation" in headline_text or "probe" in headline_text:
         formats.append("investigation_report")
-    if any("strike" in s["title"].lower() or "protest" in s["title"].lower()
-           for s in stories_raw):
+    if "strike" in headline_text or "protest" in headline_text:
         formats.append("field_report")
 
     context = {
@@ -277,29 +482,106 @@ def scrape_news_context():
         "topic_counts": topic_counts,
         "timestamp": datetime.now().isoformat(),
     }
+    return context
 
-    print(f"  Scraped {len(headlines)} headlines. Register: {register}. "
-          f"Topics: {trending}. Conflicts: {conflict_types}")
-    print(f"  Story blueprints: {len(blueprints)} extracted")
 
-    # ── Update style library if available ──
+def _fetch_one(source_name, feed_url):
+    """Fetch and parse one RSS feed. Returns a list of story dicts ([] on failure)."""
+    stories = []
+    state = _FEED_STATE.get(feed_url) if _FEED_STATE else None
     try:
-        from agents.style_memory import load_style_library, update_from_scrape, save_style_library
-        library = load_style_library()
-        library = update_from_scrape(library, blueprints, register, topic_counts)
-        save_style_library(library)
-        print(f"  Style library updated: {library.get('total_scrapes', 0)} total scrapes, "
-              f"{len(library.get('headline_templates', []))} templates")
+        # Conditional request: only when we still hold the stories to reuse
+        headers = {}
+        if state and state.get("stories"):
+            if state.get("etag"):
+                headers["If-None-Match"] = state["etag"]
+            if state.get("modified"):
+                headers["If-Modified-Since"] = state["modified"]
+        resp = _SESSION.get(feed_url, timeout=10, headers=headers)
+        if resp.status_code == 304 and headers:
+            return [dict(story) for story in state["stories"]]
+        resp.raise_for_status()
+        feed = _parse_feed(resp.content)
+        for entry in feed.entries[:18]:
+            title = entry.get("title", "").strip()
+            summary = ""
+            if entry.get("summary"):
+                summary = _clean_html(entry["summary"])[:400]
+            elif entry.get("description"):
+                summary = _clean_html(entry["description"])[:400]
+
+            if title:
+                stories.append({
+                    "source": source_name,
+                    "title": title,
+                    "summary": summary,
+                })
     except Exception as e:
-        print(f"  Warning: Could not update style library: {e}")
+        print(f"  Warning: Could not fetch {source_name}: {e}")
+        return []
+
+    if _FEED_STATE is not None:
+        etag = resp.headers.get("ETag")
+        modified = resp.headers.get("Last-Modified")
+        if etag or modified:
+            _FEED_STATE[feed_url] = {"etag": etag, "modified": modified, "stories": stories}
+        else:
+            _FEED_STATE.pop(feed_url, None)
+    return stories
 
-    return context
+
+def _load_feed_state():
+    """Load saved feed validators from disk (once per process)."""
+    global _FEED_STATE
+    if _FEED_STATE is not None:
+        return
+    try:
+        with open(FEED_STATE_PATH, "r") as f:
+            _FEED_STATE = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        _FEED_STATE = {}
+
+
+def _save_feed_state():
+    """Write feed validators to disk (best effort)."""
+    try:
+        os.makedirs(os.path.dirname(FEED_STATE_PATH), exist_ok=True)
+        with open(FEED_STATE_PATH, "w") as f:
+            json.dump(_FEED_STATE, f)
+    except OSError:
+        pass
+
+
+def _parse_feed(content):
+    """Parse raw feed bytes, preferring fastfeedparser when available."""
+    if fastfeedparser is not None:
+        try:
+            return fastfeedparser.parse(content)
+        except Exception:
+            pass
+    return feedparser.parse(content)
 
 
 # ─────────────────────────────────────────────────────
 # Blueprint extraction
 # ─────────────────────────────────────────────────────
 
+_NON_WORD_RE = re.compile(r"\W+")
+
+
+def _dedupe_by_title(stories):
+    """Drop stories whose normalized title (lowercase, word chars only) was already seen."""
+    seen = set()
+    unique = []
+    for story in stories:
+        normalized = _NON_WORD_RE.sub("", story["title"].lower())
+        digest = hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).digest()
+        if digest not in seen:
+            seen.add(digest)
+            unique.append(story)
+    return unique
+
+
 def _extract_story_blueprints(stories, max_blueprints=8):
     """
     Extract detailed 'story blueprints' from real headlines and summaries.
@@ -316,10 +598,7 @@ def _extract_story_blueprints(stories, max_blueprints=8):
     seen_keys = set()
 
     for story in stories:
-        title = story["title"]
-        summary = story.get("summary", "")
-        source = story.get("source", "")
-        combined = f"{title} {summary}".lower()
+        combined = f"{story['title']} {story.get('summary', '')}".lower()
 
         # Classify topic (score-based, not first-match)
         topic = _classify_topic(combined)
@@ -335,25 +614,10 @@ def _extract_story_blueprints(stories, max_blueprints=8):
             continue
         seen_keys.add(key)
 
-        # Build the blueprint
-        headline_frame = _anonymize_text(title)
-        summary_frame = _anonymize_text(summary) if summary else ""
-        framing = _detect_framing_style(title, summary)
-        specifics = _extract_specifics(title, summary)
-
-        # Skip if anonymization produced something too short/empty
-        if len(headline_frame) < 15:
+        blueprint = _build_blueprint(story, topic, conflict)
+        if blueprint is None:
             continue
-
-        blueprints.append({
-            "headline_frame": headline_frame,
-            "summary_frame": summary_frame,
-            "topic": topic,
-            "conflict_type": conflict,
-            "specifics": specifics,
-            "framing_style": framing,
-            "source": source,
-        })
+        blueprints.append(blueprint)
 
         if len(blueprints) >= max_blueprints:
             break
@@ -361,30 +625,109 @@ def _extract_story_blueprints(stories, max_blueprints=8):
     return blueprints
 
 
-def _classify_topic(text_lower):
-    """Score-based topic classification. Returns best topic or None."""
+def _build_blueprint(story, topic, conflict):
+    """
+    Anonymize and annotate one classified story. Returns the blueprint dict,
+    or None if the anonymized headline is too short to be useful.
+
+    Runs serially: the work is pure-Python regex/dict processing that holds
+    the GIL, and _extract_story_blueprints stops as soon as it has enough.
+    """
+    title = story["title"]
+    summary = story.get("summary", "")
+
+    # Headline first, so a story rejected for a too-short frame skips the
+    # summary/framing/specifics passes
+    headline_frame = _anonymize_text(title)
+    if len(headline_frame) < 15:
+        return None
+
+    return {
+        "headline_frame": headline_frame,
+        "summary_frame": _anonymize_text(summary) if summary else "",
+        "topic": topic,
+        "conflict_type": conflict,
+        "specifics": _extract_specifics(title, summary),
+        "framing_style": _detect_framing_style(title, summary),
+        "source": story.get("source", ""),
+    }
+
+
+def _keyword_scores(text_lower, table):
+    """
+    Count keyword hits per category; only categories with hits are returned.
+    Keywords match as substrings, so stems cover inflections
+    ("impeach" → "impeached", "storm" → "storms").
+    """
     scores = {}
-    for topic, keywords in TOPIC_KEYWORDS.items():
+    for name, keywords in table.items():
         score = sum(1 for kw in keywords if kw in text_lower)
         if score > 0:
-            scores[topic] = score
+            scores[name] = score
+    return scores
+
+
+def _argmax(scores):
+    """Key with the highest value (first one on ties, like max(d, key=d.get))."""
+    best_key, best_value = None, None
+    for key, value in scores.items():
+        if best_value is None or value > best_value:
+            best_key, best_value = key, value
+    return best_key
+
+
+def _classify_topic(text_lower):
+    """Score-based topic classification. Returns best topic or None."""
+    scores = _keyword_scores(text_lower, TOPIC_KEYWORDS)
     if not scores:
         return None
-    return max(scores, key=scores.get)
+    return _argmax(scores)
 
 
 def _classify_conflict(text_lower):
     """Score-based conflict type classification."""
-    scores = {}
-    for ctype, keywords in CONFLICT_PATTERNS.items():
-        score = sum(1 for kw in keywords if kw in text_lower)
-        if score > 0:
-            scores[ctype] = score
+    scores = _keyword_scores(text_lower, CONFLICT_PATTERNS)
     if not scores:
         return "development"
-    return max(scores, key=scores.get)
+    return _argmax(scores)
+
+
+# Words that mark a capitalized sequence as a role/place rather than a name
+# (kept: agency acronyms, US state/city names, common role words)
+_SAFE_WORDS = {
+    "the", "a", "an", "in", "on", "at", "to", "for", "of", "by", "and",
+    "or", "but", "with", "from", "after", "before", "during", "about",
+    "new", "old", "federal", "state", "local", "national", "united",
+    "north", "south", "east", "west", "president", "governor", "senator",
+    "representative", "mayor", "chief", "director", "secretary",
+    "department", "agency", "bureau", "commission", "administration",
+    "court", "supreme", "district", "appeals",
+}
+_AGENCY_ACRONYMS = {
+    "EPA", "FBI", "FEMA", "DHS", "FAA", "NLRB", "ACLU", "NATO", "FDA",
+    "CDC", "DOD", "DOE", "HUD", "SEC", "CIA", "NSA", "TSA", "ICE",
+    "OSHA", "IRS", "DOJ", "ATF", "DEA", "NTSB", "USDA", "FCC", "FTC",
+    "NIH", "NOAA", "NASA", "HHS", "DOT", "WHO", "IMF", "UN", "EU",
+}
 
+# Sequences of 2-3 capitalized words that look like names
+# (not at the very start of text, to avoid replacing sentence starters)
+_UNKNOWN_NAME_RE = re.compile(r'(?<=\s)([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2})(?=[\s,\.\;\:\'\"])')
 
+
+def _replace_unknown_names(match):
+    """Replace an unknown proper name sequence (e.g., "John Smith") with "an official"."""
+    words = match.group(0).split()
+    # Don't replace if it's a known safe pattern or short
+    if len(words) < 2:
+        return match.group(0)
+    for w in words:
+        if w.upper() in _AGENCY_ACRONYMS or w.lower() in _SAFE_WORDS:
+            return match.group(0)
+    return "an official"
+
+
+@functools.lru_cache(maxsize=2048)
 def _anonymize_text(text):
     """
     Strip real names of people and companies while preserving structure,
@@ -395,58 +738,33 @@ def _anonymize_text(text):
 
     result = text
 
-    # 1. Replace known real people with role descriptions
-    if _PEOPLE_ROLES:
-        for name, role in sorted(_PEOPLE_ROLES.items(), key=lambda x: len(x[0]), reverse=True):
-            pattern = re.compile(re.escape(name), re.IGNORECASE)
-            result = pattern.sub(role, result)
-
-    # 2. Replace known companies with sector descriptions
-    if _COMPANY_SECTORS:
-        for co, sector in sorted(_COMPANY_SECTORS.items(), key=lambda x: len(x[0]), reverse=True):
-            pattern = re.compile(r'\b' + re.escape(co) + r'\b', re.IGNORECASE)
-            result = pattern.sub(sector, result)
+    # 1-2. Replace known real people with role descriptions and known
+    # companies with sector descriptions, in one scan
+    if _NAME_RE is not None:
+        lowered = result.lower()
+        if len(lowered) == len(result):
+            # Match on the lowercase copy, splice replacements into the original
+            pieces = []
+            pos = 0
+            for match in _NAME_RE.finditer(lowered):
+                pieces.append(result[pos:match.start()])
+                pieces.append(_replace_known_name(match))
+                pos = match.end()
+            if pieces:
+                pieces.append(result[pos:])
+                result = "".join(pieces)
+        else:
+            result = _NAME_RE_IGNORECASE.sub(_replace_known_name, result)
 
     # 3. Strip remaining likely proper nouns that aren't known entities
     # (two+ consecutive capitalized words not at sentence start, not agency/place)
-    # Keep: agency acronyms, US state/city names, common role words
-    _safe_words = {
-        "the", "a", "an", "in", "on", "at", "to", "for", "of", "by", "and",
-        "or", "but", "with", "from", "after", "before", "during", "about",
-        "new", "old", "federal", "state", "local", "national", "united",
-        "north", "south", "east", "west", "president", "governor", "senator",
-        "representative", "mayor", "chief", "director", "secretary",
-        "department", "agency", "bureau", "commission", "administration",
-        "court", "supreme", "district", "appeals",
-    }
-    _agency_acronyms = {
-        "EPA", "FBI", "FEMA", "DHS", "FAA", "NLRB", "ACLU", "NATO", "FDA",
-        "CDC", "DOD", "DOE", "HUD", "SEC", "CIA", "NSA", "TSA", "ICE",
-        "OSHA", "IRS", "DOJ", "ATF", "DEA", "NTSB", "USDA", "FCC", "FTC",
-        "NIH", "NOAA", "NASA", "HHS", "DOT", "WHO", "IMF", "UN", "EU",
-    }
-
-    # Replace unknown proper name sequences (e.g., "John Smith") with "an official"
-    def _replace_unknown_names(match):
-        words = match.group(0).split()
-        # Don't replace if it's a known safe pattern or short
-        if len(words) < 2:
-            return match.group(0)
-        for w in words:
-            if w.upper() in _agency_acronyms or w.lower() in _safe_words:
-                return match.group(0)
-        return "an official"
-
-    # Match sequences of 2-3 capitalized words that look like names
-    # (not at the very start of text, to avoid replacing sentence starters)
-    result = re.sub(
-        r'(?<=\s)([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2})(?=[\s,\.\;\:\'\"])',
-        _replace_unknown_names,
-        result
-    )
+    # A candidate needs at least two capital letters; most anonymized
+    # headlines have fewer, so skip the regex for them
+    if sum(map(str.isupper, result)) >= 2:
+        result = _UNKNOWN_NAME_RE.sub(_replace_unknown_names, result)
 
     # Clean up any double spaces or awkward phrasing
-    result = re.sub(r'\s+', ' ', result).strip()
+    result = " ".join(result.split())
 
     return result
 
@@ -459,15 +777,49 @@ def _detect_framing_style(title, summary):
     """
     combined = f"{title} {summary}".lower()
 
-    scores = {}
-    for style, keywords in FRAMING_PATTERNS.items():
-        score = sum(1 for kw in keywords if kw in combined)
-        if score > 0:
-            scores[style] = score
-
+    scores = _keyword_scores(combined, FRAMING_PATTERNS)
     if not scores:
         return "development"
-    return max(scores, key=scores.get)
+    return _argmax(scores)
+
+
+# Number patterns: dollar amounts, percentages, counts with units
+_DOLLAR_RE = re.compile(r'\$[\d,.]+\s*(?:billion|million|trillion|thousand|B|M|T)?', re.IGNORECASE)
+_PCT_RE = re.compile(r'\d+(?:\.\d+)?%')
+_COUNT_UNIT_RE = re.compile(r'\b(\d{1,6})\s+(people|workers|employees|students|residents|homes|'
+                            r'flights|vehicles|patients|deaths|cases|troops|officers|migrants|'
+                            r'acres|miles|schools|hospitals|companies|jobs)\b')
+
+# US regions
+REGION_PATTERNS = {
+    "Midwest": ["midwest", "ohio", "michigan", "illinois", "indiana", "iowa", "wisconsin", "minnesota"],
+    "Southeast": ["southeast", "georgia", "alabama", "florida", "carolina", "tennessee", "mississippi"],
+    "Northeast": ["northeast", "new york", "new jersey", "connecticut", "massachusetts", "pennsylvania"],
+    "Southwest": ["southwest", "texas", "arizona", "new mexico", "nevada"],
+    "West Coast": ["west coast", "california", "oregon", "washington state"],
+    "Gulf Coast": ["gulf coast", "louisiana", "mississippi coast"],
+    "Pacific Northwest": ["pacific northwest"],
+}
+
+# Stakes level keywords
+HIGH_STAKES = ["billion", "million", "crisis", "emergency", "death", "killed",
+               "national security", "pandemic", "war", "collapse"]
+LOW_STAKES = ["local", "community", "neighborhood", "school board", "county"]
+CRITICAL_STAKES = ["trillion", "nuclear", "catastrophe", "mass casualty", "martial law"]
+
+# Institutional actors (roles/agencies mentioned), matched on lowercased text
+_ACTOR_RES = [(re.compile(pattern), label) for pattern, label in [
+    (r'\b(?:EPA|FBI|FEMA|DHS|FAA|CDC|FDA|DOJ|DOD|SEC|OSHA|NTSB|ATF|DEA|TSA|HHS)\b', "federal agency"),
+    (r'\b(?:president|white house|administration)\b', "executive branch"),
+    (r'\b(?:senate|congress|house|committee|lawmaker|legislat)\b', "legislature"),
+    (r'\b(?:court|judge|ruling|justice)\b', "judiciary"),
+    (r'\b(?:governor|state legislat|state attorney)\b', "state government"),
+    (r'\b(?:police|sheriff|officer|law enforcement)\b', "law enforcement"),
+    (r'\b(?:union|worker|labor|employee)\b', "labor/workers"),
+    (r'\b(?:company|corporation|firm|manufacturer|bank)\b', "private sector"),
+    (r'\b(?:hospital|doctor|physician|nurse|health system)\b', "healthcare"),
+    (r'\b(?:university|school|professor|researcher)\b', "academia"),
+]]
 
 
 def _extract_specifics(title, summary):
@@ -480,32 +832,13 @@ def _extract_specifics(title, summary):
     combined_lower = combined.lower()
 
     # Extract numbers (dollar amounts, percentages, counts)
-    numbers = []
-    # Dollar amounts
-    for match in re.finditer(r'\$[\d,.]+\s*(?:billion|million|trillion|thousand|B|M|T)?', combined, re.IGNORECASE):
-        numbers.append(match.group(0).strip())
-    # Percentages
-    for match in re.finditer(r'\d+(?:\.\d+)?%', combined):
-        numbers.append(match.group(0))
-    # Counts with units
-    for match in re.finditer(r'\b(\d{1,6})\s+(people|workers|employees|students|residents|homes|'
-                             r'flights|vehicles|patients|deaths|cases|troops|officers|migrants|'
-                             r'acres|miles|schools|hospitals|companies|jobs)\b', combined_lower):
-        numbers.append(f"{match.group(1)} {match.group(2)}")
+    numbers = [match.group(0).strip() for match in _DOLLAR_RE.finditer(combined)]
+    numbers.extend(match.group(0) for match in _PCT_RE.finditer(combined))
+    numbers.extend(f"{match.group(1)} {match.group(2)}" for match in _COUNT_UNIT_RE.finditer(combined_lower))
 
     # Geographic detail
     geo = ""
-    # US regions
-    region_patterns = {
-        "Midwest": ["midwest", "ohio", "michigan", "illinois", "indiana", "iowa", "wisconsin", "minnesota"],
-        "Southeast": ["southeast", "georgia", "alabama", "florida", "carolina", "tennessee", "mississippi"],
-        "Northeast": ["northeast", "new york", "new jersey", "connecticut", "massachusetts", "pennsylvania"],
-        "Southwest": ["southwest", "texas", "arizona", "new mexico", "nevada"],
-        "West Coast": ["west coast", "california", "oregon", "washington state"],
-        "Gulf Coast": ["gulf coast", "louisiana", "mississippi coast"],
-        "Pacific Northwest": ["pacific northwest"],
-    }
-    for region, keywords in region_patterns.items():
+    for region, keywords in REGION_PATTERNS.items():
         if any(kw in combined_lower for kw in keywords):
             geo = region
             break
@@ -517,35 +850,15 @@ def _extract_specifics(title, summary):
 
     # Stakes level
     stakes = "medium"
-    high_stakes = ["billion", "million", "crisis", "emergency", "death", "killed",
-                   "national security", "pandemic", "war", "collapse"]
-    low_stakes = ["local", "community", "neighborhood", "school board", "county"]
-    critical_stakes = ["trillion", "nuclear", "catastrophe", "mass casualty", "martial law"]
-
-    if any(w in combined_lower for w in critical_stakes):
+    if any(w in combined_lower for w in CRITICAL_STAKES):
         stakes = "critical"
-    elif any(w in combined_lower for w in high_stakes):
+    elif any(w in combined_lower for w in HIGH_STAKES):
         stakes = "high"
-    elif any(w in combined_lower for w in low_stakes):
+    elif any(w in combined_lower for w in LOW_STAKES):
         stakes = "low"
 
     # Institutional actors (roles/agencies mentioned)
-    actors = set()
-    actor_patterns = [
-        (r'\b(?:EPA|FBI|FEMA|DHS|FAA|CDC|FDA|DOJ|DOD|SEC|OSHA|NTSB|ATF|DEA|TSA|HHS)\b', "federal agency"),
-        (r'\b(?:president|white house|administration)\b', "executive branch"),
-        (r'\b(?:senate|congress|house|committee|lawmaker|legislat)\b', "legislature"),
-        (r'\b(?:court|judge|ruling|justice)\b', "judiciary"),
-        (r'\b(?:governor|state legislat|state attorney)\b', "state government"),
-        (r'\b(?:police|sheriff|officer|law enforcement)\b', "law enforcement"),
-        (r'\b(?:union|worker|labor|employee)\b', "labor/workers"),
-        (r'\b(?:company|corporation|firm|manufacturer|bank)\b', "private sector"),
-        (r'\b(?:hospital|doctor|physician|nurse|health system)\b', "healthcare"),
-        (r'\b(?:university|school|professor|researcher)\b', "academia"),
-    ]
-    for pattern, label in actor_patterns:
-        if re.search(pattern, combined_lower):
-            actors.add(label)
+    actors = {label for pattern, label in _ACTOR_RES if pattern.search(combined_lower)}
 
     return {
         "numbers": numbers[:5],  # Cap at 5
@@ -556,9 +869,16 @@ def _extract_specifics(title, summary):
     }
 
 
+# HTML tags (dropped) or named entities (become a space), in one pass
+_TAG_OR_ENTITY_RE = re.compile(r'<[^>]+>|&[a-zA-Z]+;')
+
+
+def _tag_or_entity_replacement(match):
+    return '' if match.group(0)[0] == '<' else ' '
+
+
+@functools.lru_cache(maxsize=2048)
 def _clean_html(text):
     """Strip HTML tags from RSS descriptions."""
-    cleaned = re.sub(r'<[^>]+>', '', text)
-    cleaned = re.sub(r'&[a-zA-Z]+;', ' ', cleaned)
-    cleaned = re.sub(r'\s+', ' ', cleaned)
-    return cleaned.strip()
+    cleaned = _TAG_OR_ENTITY_RE.sub(_tag_or_entity_replacement, text)
+    return " ".join(cleaned.split())
@@ -9,8 +9,17 @@ an increasingly rich and diverse pool of patterns for the writer.
 import json
 import os
 import re
+import tempfile
+from collections import deque
 from datetime import datetime, timedelta
 
+# C JSON encoder/decoder, much faster than the stdlib json module.
+# Optional: json is used when it isn't installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 STYLE_LIBRARY_PATH = os.path.join(
     os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
     "style_library.json"
@@ -20,6 +29,37 @@ MAX_HEADLINE_TEMPLATES = 200
 MAX_EXAMPLES_PER_STYLE = 20
 MAX_REGISTER_HISTORY = 30  # days
 
+# ── Headline templatizing patterns (compiled once) ──
+# Numbers/dollar amounts, applied in this order
+_AMOUNT_RE = re.compile(r'\$[\d,.]+\s*(?:billion|million|trillion|thousand|B|M|T)?', re.IGNORECASE)
+_PERCENT_RE = re.compile(r'\d+(?:\.\d+)?%')
+_NUMBER_RE = re.compile(r'\b\d{2,}\b')
+
+# Institutional role phrases, one alternation; each group is named after
+# the placeholder that replaces it
+_ROLE_RE = re.compile("|".join(f"(?P<{placeholder}>{pattern})" for pattern, placeholder in [
+    (r'\b(?:federal|state|local)\s+(?:agency|regulator|authority|commission|bureau|department)\b',
+     'Agency'),
+    (r'\b(?:a (?:senior|top|prominent|leading)\s+(?:official|lawmaker|executive|diplomat))\b',
+     'Official'),
+    (r'\b(?:a major\s+(?:corporation|company|manufacturer|bank|firm|insurer|automaker|'
+     r'technology company|aerospace manufacturer|energy company|pharmaceutical company|'
+     r'defense contractor|retail chain|streaming service|social media company|'
+     r'online retail corporation|software corporation|electric vehicle maker|'
+     r'entertainment company|social media conglomerate|social media platform|'
+     r'AI company|healthcare corporation|technology conglomerate|investment bank|'
+     r'oil corporation|health insurer))\b',
+     'Organization'),
+    (r'\b(?:a state governor)\b', 'Governor'),
+    (r'\b(?:the President|the Vice President|the former President)\b', 'Leader'),
+]), re.IGNORECASE)
+
+# (mtime_ns, size, topic) of the library file → writer context built from it
+_style_context_cache = None
+
+_PLACEHOLDER_RE = re.compile(r'\[(?:Amount|Percent|Number|Agency|Official|Organization|Governor|Leader)\]')
+_WS_RE = re.compile(r'\s+')
+
 
 def _empty_library():
     """Return a fresh empty style library."""
@@ -40,17 +80,65 @@ def load_style_library():
     if not os.path.exists(STYLE_LIBRARY_PATH):
         return _empty_library()
     try:
-        with open(STYLE_LIBRARY_PATH, "r") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
+        with open(STYLE_LIBRARY_PATH, "rb") as f:
+            data = f.read()
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        library = orjson.loads(data) if orjson else json.loads(data)
+    except (json.JSONDecodeError, UnicodeDecodeError, IOError):
         return _empty_library()
+    # Example lists become bounded deques: appending past the cap evicts
+    # the oldest in O(1)
+    for style_data in library.get("framing_styles", {}).values():
+        style_data["examples"] = deque(style_data.get("examples", []), maxlen=MAX_EXAMPLES_PER_STYLE)
+    return library
+
+
+def load_style_context(topic=None):
+    """
+    Return get_style_context_for_writer() for the library on disk.
+    The library is only re-read and re-summarized when the file changes,
+    so writing a batch of stories parses it once instead of per story.
+    """
+    global _style_context_cache
+    try:
+        st = os.stat(STYLE_LIBRARY_PATH)
+        key = (st.st_mtime_ns, st.st_size, topic)
+    except OSError:
+        key = None
+    if key is not None and _style_context_cache is not None and _style_context_cache[0] == key:
+        return _style_context_cache[1]
+    context = get_style_context_for_writer(load_style_library(), topic)
+    if key is not None:
+        _style_context_cache = (key, context)
+    return context
 
 
 def save_style_library(library):
-    """Write the style library to disk."""
+    """
+    Write the style library to disk. The JSON goes to a temp file that
+    replaces the library in one step, so a crash mid-write can't leave
+    a truncated file behind.
+    """
     library["last_updated"] = datetime.now().isoformat()
-    with open(STYLE_LIBRARY_PATH, "w") as f:
-        json.dump(library, f, indent=2)
+    # default=list: example deques are stored as plain JSON lists
+    if orjson:
+        data = orjson.dumps(library, default=list, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(library, indent=2, default=list).encode("utf-8")
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(STYLE_LIBRARY_PATH), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        # mkstemp creates the file 0600; keep the library's existing mode
+        try:
+            mode = os.stat(STYLE_LIBRARY_PATH).st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o644
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, STYLE_LIBRARY_PATH)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
 
 
 def update_from_scrape(library, blueprints, register, topic_counts):
@@ -65,47 +153,53 @@ def update_from_scrape(library, blueprints, register, topic_counts):
     library["total_scrapes"] = library.get("total_scrapes", 0) + 1
     today = datetime.now().strftime("%Y-%m-%d")
 
-    # ── Update framing styles ──
+    # ── Single pass over blueprints: framing styles, headline templates,
+    #    conflict type counts ──
     framing_styles = library.get("framing_styles", {})
+    templates = library.get("headline_templates", [])
+    # Index by template text: membership test and lookup in one dict
+    templates_by_key = {t["template"]: t for t in templates}
+    conflict_freq = library.get("conflict_type_frequency", {})
+
     for bp in blueprints:
+        headline = bp.get("headline_frame", "")
+
+        # Increment framing style count, add headline as example (dedup, cap)
         style = bp.get("framing_style", "development")
         if style not in framing_styles:
-            framing_styles[style] = {"count": 0, "examples": []}
+            framing_styles[style] = {"count": 0, "examples": deque(maxlen=MAX_EXAMPLES_PER_STYLE)}
         framing_styles[style]["count"] += 1
-        # Add headline as example (dedup, cap)
-        headline = bp.get("headline_frame", "")
         examples = framing_styles[style]["examples"]
+        if not isinstance(examples, deque):
+            examples = framing_styles[style]["examples"] = deque(examples, maxlen=MAX_EXAMPLES_PER_STYLE)
         if headline and headline not in examples:
-            examples.append(headline)
-            if len(examples) > MAX_EXAMPLES_PER_STYLE:
-                examples.pop(0)  # Drop oldest
-    library["framing_styles"] = framing_styles
+            examples.append(headline)  # Full deque drops the oldest
 
-    # ── Extract and store headline templates ──
-    templates = library.get("headline_templates", [])
-    existing_templates = {t["template"] for t in templates}
+        ctype = bp.get("conflict_type", "development")
+        conflict_freq[ctype] = conflict_freq.get(ctype, 0) + 1
 
-    for bp in blueprints:
-        headline = bp.get("headline_frame", "")
+        # Extract and store headline template
         if not headline or len(headline) < 20:
             continue
         template = _templatize_headline(headline)
-        if template and template not in existing_templates:
-            templates.append({
+        if not template:
+            continue
+        entry = templates_by_key.get(template)
+        if entry is None:
+            entry = {
                 "template": template,
                 "topic": bp.get("topic", ""),
                 "times_seen": 1,
                 "last_seen": today,
                 "example": headline[:120],
-            })
-            existing_templates.add(template)
-        elif template:
+            }
+            templates.append(entry)
+            templates_by_key[template] = entry
+        else:
             # Increment times_seen for existing template
-            for t in templates:
-                if t["template"] == template:
-                    t["times_seen"] = t.get("times_seen", 1) + 1
-                    t["last_seen"] = today
-                    break
+            entry["times_seen"] = entry.get("times_seen", 1) + 1
+            entry["last_seen"] = today
+    library["framing_styles"] = framing_styles
 
     # Cap at max
     if len(templates) > MAX_HEADLINE_TEMPLATES:
@@ -126,12 +220,7 @@ def update_from_scrape(library, blueprints, register, topic_counts):
             topic_dist[topic] = round(new_ratio, 4)
     library["topic_distribution"] = topic_dist
 
-    # ── Update conflict type frequency ──
-    conflict_freq = library.get("conflict_type_frequency", {})
-    for bp in blueprints:
-        ctype = bp.get("conflict_type", "development")
-        conflict_freq[ctype] = conflict_freq.get(ctype, 0) + 1
-    # Normalize to proportions
+    # ── Normalize conflict type frequency to proportions ──
     total_conflicts = sum(conflict_freq.values()) or 1
     for ctype in conflict_freq:
         conflict_freq[ctype] = round(conflict_freq[ctype] / total_conflicts, 4)
@@ -161,39 +250,21 @@ def _templatize_headline(headline):
     result = headline
 
     # Replace numbers/dollar amounts with placeholders
-    result = re.sub(r'\$[\d,.]+\s*(?:billion|million|trillion|thousand|B|M|T)?', '[Amount]', result, flags=re.IGNORECASE)
-    result = re.sub(r'\d+(?:\.\d+)?%', '[Percent]', result)
-    result = re.sub(r'\b\d{2,}\b', '[Number]', result)
+    result = _AMOUNT_RE.sub('[Amount]', result)
+    result = _PERCENT_RE.sub('[Percent]', result)
+    result = _NUMBER_RE.sub('[Number]', result)
 
     # Replace institutional role phrases with placeholders
-    role_patterns = [
-        (r'\b(?:federal|state|local)\s+(?:agency|regulator|authority|commission|bureau|department)\b',
-         '[Agency]'),
-        (r'\b(?:a (?:senior|top|prominent|leading)\s+(?:official|lawmaker|executive|diplomat))\b',
-         '[Official]'),
-        (r'\b(?:a major\s+(?:corporation|company|manufacturer|bank|firm|insurer|automaker|'
-         r'technology company|aerospace manufacturer|energy company|pharmaceutical company|'
-         r'defense contractor|retail chain|streaming service|social media company|'
-         r'online retail corporation|software corporation|electric vehicle maker|'
-         r'entertainment company|social media conglomerate|social media platform|'
-         r'AI company|healthcare corporation|technology conglomerate|investment bank|'
-         r'oil corporation|health insurer))\b',
-         '[Organization]'),
-        (r'\b(?:a state governor)\b', '[Governor]'),
-        (r'\b(?:the President|the Vice President|the former President)\b', '[Leader]'),
-    ]
-
-    for pattern, placeholder in role_patterns:
-        result = re.sub(pattern, placeholder, result, flags=re.IGNORECASE)
+    result = _ROLE_RE.sub(lambda m: f"[{m.lastgroup}]", result)
 
     # Don't return if template is too similar to original (not enough abstracted)
-    placeholders = len(re.findall(r'\[(?:Amount|Percent|Number|Agency|Official|Organization|Governor|Leader)\]', result))
+    placeholders = len(_PLACEHOLDER_RE.findall(result))
     if placeholders == 0:
         # Still useful as a structural template even without placeholders
         pass
 
     # Clean up
-    result = re.sub(r'\s+', ' ', result).strip()
+    result = _WS_RE.sub(' ', result).strip()
 
     # Skip if too short after processing
     if len(result) < 10:
@@ -6,12 +6,58 @@ Supports:
 - Multi-voice generation for hourly summaries (alternating anchors)
 """
 
+import hashlib
+import json
 import re
 import os
 import subprocess
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from agents.fileutil import link_or_copy
+
+# Reads MP3 durations in-process from the frame headers.
+# Optional: ffprobe is used when it isn't installed or can't read a file.
+try:
+    from mutagen.mp3 import MP3
+except ImportError:
+    MP3 = None
+
+# Fallback voice for anchors without a configured voice ID, and the
+# placeholder value config.example.yaml ships with
+_DEFAULT_VOICE_ID = "21m00Tcm4TlvDq8ikWAM"
+_PLACEHOLDER_VOICE_ID = "PASTE_VOICE_ID_HERE"
+
+# One ElevenLabs client per API key, shared across calls and threads so
+# its HTTP connection pool (keep-alive) is reused
+_clients = {}
+_clients_lock = threading.Lock()
+
+# Synthesized audio keyed by a hash of the full TTS request (voice, model,
+# format, voice settings, speed, text), so re-running a script is served
+# from disk instead of a new paid synthesis. Opt-in (config: tts.cache):
+# segment text rarely repeats and entries are never evicted.
+TTS_CACHE_DIR = Path(os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "cache", "tts"
+))
+
+# ElevenLabs raw output used when tts.pcm_segments is on:
+# signed 16-bit little-endian mono at 44.1 kHz
+PCM_FORMAT = "pcm_44100"
+PCM_FFMPEG_INPUT = ["-f", "s16le", "-ar", "44100", "-ac", "1"]
+
+# Tag/markdown stripping patterns, applied in this order by _strip_tags
+_VISUAL_TAG_RE = re.compile(r'\[(?:CHYRON|B-ROLL):\s*[^\]]+\]')
+_BOLD_RE = re.compile(r'\*\*([^*]+)\*\*')
+_ITALIC_RE = re.compile(r'\*([^*]+)\*')
+_HEADING_RE = re.compile(r'^#+\s*', re.MULTILINE)
+_BULLET_RE = re.compile(r'^[-*]\s+', re.MULTILINE)
+_SPEAKER_RE = re.compile(r'^[A-Z][A-Za-z\s]+:\s*')
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+
 
 def generate_audio(script_data, config):
     """
@@ -21,21 +67,20 @@ def generate_audio(script_data, config):
         - audio_path: path to the generated .mp3 file
         - actual_duration_seconds: measured duration
     """
-    from elevenlabs import ElevenLabs
-
     api_key = config["apis"]["elevenlabs_key"]
     anchor_name = script_data["anchor"]
     voice_id = _get_voice_id(anchor_name, config)
     clean_script = _strip_tags(script_data["script"])
 
-    client = ElevenLabs(api_key=api_key)
+    client = _get_client(api_key)
 
     output_dir = Path(tempfile.gettempdir()) / "tnn_audio"
     output_dir.mkdir(exist_ok=True)
     audio_path = output_dir / f"{script_data['story_id']}.mp3"
 
     speed = _get_anchor_speed(anchor_name, config)
-    _generate_tts_file(client, voice_id, clean_script, str(audio_path), speed=speed)
+    _generate_tts_file(client, voice_id, clean_script, str(audio_path), speed=speed,
+                       use_cache=config.get("tts", {}).get("cache", False))
     actual_duration = _measure_duration(str(audio_path))
 
     print(f"  Audio generated: {audio_path.name} ({actual_duration:.1f}s)")
@@ -46,7 +91,33 @@ def generate_audio(script_data, config):
     }
 
 
-def generate_hourly_audio(summary_data, config):
+def generate_audio_batch(scripts, config, max_workers=6):
+    """
+    Generate audio for several single-anchor scripts concurrently.
+
+    Each generate_audio() call mostly waits on ElevenLabs, so the stories
+    are synthesized on a thread pool (sharing one client) instead of
+    back to back.
+
+    Returns a dict mapping story_id → generate_audio() result
+    (None where generation failed).
+    """
+    if not scripts:
+        return {}
+
+    def _generate(script_data):
+        try:
+            return generate_audio(script_data, config)
+        except Exception as e:
+            print(f"  WARNING: Audio generation error for {script_data.get('story_id', 'unknown')}: {e}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(scripts))) as pool:
+        results = pool.map(_generate, scripts)
+        return {s.get("story_id", "unknown"): r for s, r in zip(scripts, results)}
+
+
+def generate_hourly_audio(summary_data, config, max_workers=8):
     """
     Generate multi-voice audio for an hourly summary.
 
@@ -54,13 +125,15 @@ def generate_hourly_audio(summary_data, config):
     generates TTS for each segment with the correct voice,
     then concatenates them with ffmpeg.
 
+    TTS calls are dominated by waiting on ElevenLabs, so segments are
+    requested concurrently on a thread pool; a segment that fails is
+    logged and left out of the concatenation.
+
     Returns a dict with:
         - audio_path: path to the final concatenated .mp3
         - actual_duration_seconds: total duration
         - segment_count: number of TTS segments generated
     """
-    from elevenlabs import ElevenLabs
-
     api_key = config["apis"]["elevenlabs_key"]
     segments = summary_data.get("segments", [])
     story_id = summary_data.get("story_id", "hourly")
@@ -68,27 +141,54 @@ def generate_hourly_audio(summary_data, config):
     if not segments:
         return None
 
-    client = ElevenLabs(api_key=api_key)
+    client = _get_client(api_key)
 
     output_dir = Path(tempfile.gettempdir()) / "tnn_audio"
     output_dir.mkdir(exist_ok=True)
 
+    # Raw PCM segments join without MP3 frame seams and are encoded once
+    pcm_segments = config.get("tts", {}).get("pcm_segments", False)
+    output_format = PCM_FORMAT if pcm_segments else "mp3_44100_128"
+    extension = "pcm" if pcm_segments else "mp3"
+    use_cache = config.get("tts", {}).get("cache", False)
+
+    # Resolve each anchor's voice once, not once per segment
+    voices = {
+        name: (_get_voice_id(name, config), _get_anchor_speed(name, config))
+        for name in dict.fromkeys(seg["anchor"] for seg in segments)
+    }
+
     # Generate each segment as a separate audio file
-    segment_paths = []
-    for i, seg in enumerate(segments):
+    def _generate(indexed_segment):
+        i, seg = indexed_segment
         anchor_name = seg["anchor"]
         text = seg["text"]
-        voice_id = _get_voice_id(anchor_name, config)
+        voice_id, speed = voices[anchor_name]
 
-        seg_path = output_dir / f"{story_id}_seg{i:02d}.mp3"
-        speed = _get_anchor_speed(anchor_name, config)
+        seg_path = output_dir / f"{story_id}_seg{i:02d}.{extension}"
         print(f"  TTS segment {i+1}/{len(segments)}: {anchor_name} ({len(text.split())}w)")
-        _generate_tts_file(client, voice_id, text, str(seg_path), speed=speed)
-        segment_paths.append(str(seg_path))
+        try:
+            _generate_tts_file(client, voice_id, text, str(seg_path), speed=speed,
+                               output_format=output_format, use_cache=use_cache)
+        except Exception as e:
+            print(f"  WARNING: TTS failed for segment {i+1}/{len(segments)}: {e}")
+            return None
+        return str(seg_path)
+
+    # pool.map yields results in script order, whatever order calls finish in
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(segments))) as pool:
+        segment_paths = [p for p in pool.map(_generate, enumerate(segments)) if p]
+
+    if not segment_paths:
+        print("  WARNING: No TTS segments generated for hourly audio")
+        return None
 
     # Concatenate all segments with ffmpeg
     final_path = output_dir / f"{story_id}.mp3"
-    _concat_audio(segment_paths, str(final_path))
+    if pcm_segments:
+        _encode_pcm(segment_paths, str(final_path))
+    else:
+        _concat_audio(segment_paths, str(final_path))
 
     # Clean up segment files
     for p in segment_paths:
@@ -98,25 +198,35 @@ def generate_hourly_audio(summary_data, config):
             pass
 
     actual_duration = _measure_duration(str(final_path))
-    print(f"  Hourly audio assembled: {final_path.name} ({actual_duration:.1f}s, {len(segments)} segments)")
+    print(f"  Hourly audio assembled: {final_path.name} ({actual_duration:.1f}s, {len(segment_paths)} segments)")
 
     return {
         "audio_path": str(final_path),
         "actual_duration_seconds": actual_duration,
-        "segment_count": len(segments),
+        "segment_count": len(segment_paths),
     }
 
 
+def _get_client(api_key):
+    """Return the shared ElevenLabs client for api_key, creating it on first use."""
+    with _clients_lock:
+        client = _clients.get(api_key)
+        if client is None:
+            from elevenlabs import ElevenLabs
+            client = _clients[api_key] = ElevenLabs(api_key=api_key)
+    return client
+
+
 def _get_voice_id(anchor_name, config):
     """Look up the ElevenLabs voice ID for an anchor."""
     for anchor_cfg in config.get("anchors", []):
         if anchor_cfg["name"] == anchor_name:
             vid = anchor_cfg.get("elevenlabs_voice_id")
-            if vid and vid != "PASTE_VOICE_ID_HERE":
+            if vid and vid != _PLACEHOLDER_VOICE_ID:
                 return vid
     # Fallback
     print(f"  WARNING: No voice ID for {anchor_name}, using default")
-    return "21m00Tcm4TlvDq8ikWAM"
+    return _DEFAULT_VOICE_ID
 
 
 def _get_anchor_speed(anchor_name, config):
@@ -127,13 +237,17 @@ def _get_anchor_speed(anchor_name, config):
     return 1.0
 
 
-def _generate_tts_file(client, voice_id, text, output_path, speed=1.0):
-    """Generate a single TTS audio file with optional speed adjustment."""
+def _generate_tts_file(client, voice_id, text, output_path, speed=1.0,
+                       output_format="mp3_44100_128", use_cache=False):
+    """
+    Generate a single TTS audio file with optional speed adjustment.
+    With use_cache, identical requests are served from TTS_CACHE_DIR.
+    """
     kwargs = {
         "voice_id": voice_id,
         "text": text,
         "model_id": "eleven_multilingual_v2",
-        "output_format": "mp3_44100_128",
+        "output_format": output_format,
         "voice_settings": {
             "stability": 0.7,
             "similarity_boost": 0.8,
@@ -144,6 +258,15 @@ def _generate_tts_file(client, voice_id, text, output_path, speed=1.0):
     if speed != 1.0:
         kwargs["speed"] = speed
 
+    # Identical request already synthesized? Reuse it.
+    cache_key = hashlib.blake2b(
+        json.dumps(kwargs, sort_keys=True).encode("utf-8"), digest_size=16
+    ).hexdigest()
+    extension = "pcm" if output_format.startswith("pcm") else "mp3"
+    cache_path = TTS_CACHE_DIR / f"{cache_key}.{extension}"
+    if use_cache and cache_path.exists() and link_or_copy(cache_path, output_path):
+        return
+
     try:
         audio_generator = client.text_to_speech.convert(**kwargs)
     except TypeError:
@@ -151,17 +274,48 @@ def _generate_tts_file(client, voice_id, text, output_path, speed=1.0):
         kwargs.pop("speed", None)
         audio_generator = client.text_to_speech.convert(**kwargs)
 
-    with open(output_path, "wb") as f:
-        for chunk in audio_generator:
-            f.write(chunk)
+    # Write to a .part file and rename it into place, so a failed stream
+    # never leaves a truncated file at output_path (os.replace also swaps
+    # out any old output hard-linked into the TTS cache without touching it)
+    part_path = f"{output_path}.part"
+    try:
+        # The SDK yields small chunks; a 1 MiB buffer turns them into a few writes
+        with open(part_path, "wb", buffering=1024 * 1024) as f:
+            for chunk in audio_generator:
+                f.write(chunk)
+        os.replace(part_path, output_path)
+    except BaseException:
+        _remove_quietly(part_path)
+        raise
+
+    if not use_cache:
+        return
+    try:
+        TTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return
+    link_or_copy(output_path, cache_path)
+
+
+def _remove_quietly(path):
+    """Delete path if it exists, ignoring errors."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
 
 
 def _concat_audio(segment_paths, output_path):
     """Concatenate multiple MP3 files using ffmpeg."""
+    # Unlink first: a previous output may be hard-linked into the TTS cache
+    # and must not be overwritten in place
+    if os.path.lexists(output_path):
+        os.remove(output_path)
+
     if len(segment_paths) == 1:
-        # Just copy if only one segment
-        import shutil
-        shutil.copy2(segment_paths[0], output_path)
+        # Just link (or copy) if only one segment
+        if not link_or_copy(segment_paths[0], output_path):
+            print(f"  WARNING: could not copy {segment_paths[0]} to {output_path}")
         return
 
     # Build ffmpeg concat file
@@ -172,12 +326,45 @@ def _concat_audio(segment_paths, output_path):
         for p in segment_paths:
             f.write(f"file '{p}'\n")
 
+    # Segments all come from ElevenLabs as mp3_44100_128, so the frames can
+    # be stream-copied without decoding; re-encode only if that fails
+    for codec_args in (["-c:a", "copy"], ["-c:a", "libmp3lame", "-b:a", "128k"]):
+        result = subprocess.run(
+            [
+                "ffmpeg", "-y",
+                "-nostdin", "-hide_banner", "-loglevel", "error",
+                "-f", "concat",
+                "-safe", "0",
+                "-i", str(concat_list),
+                *codec_args,
+                output_path,
+            ],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode == 0:
+            break
+
+    # Clean up concat list
+    try:
+        concat_list.unlink()
+    except OSError:
+        pass
+
+    if result.returncode != 0:
+        print(f"  WARNING: ffmpeg concat error: {result.stderr[-200:]}")
+
+
+def _encode_pcm(segment_paths, output_path):
+    """Join raw PCM segments (byte concatenation) and encode them to MP3 once."""
+    if os.path.lexists(output_path):
+        os.remove(output_path)
     result = subprocess.run(
         [
             "ffmpeg", "-y",
-            "-f", "concat",
-            "-safe", "0",
-            "-i", str(concat_list),
+            "-nostdin", "-hide_banner", "-loglevel", "error",
+            *PCM_FFMPEG_INPUT,
+            "-i", "concat:" + "|".join(segment_paths),
             "-c:a", "libmp3lame",
             "-b:a", "128k",
             output_path,
@@ -185,32 +372,33 @@ def _concat_audio(segment_paths, output_path):
         capture_output=True,
         text=True,
     )
-
-    # Clean up concat list
-    try:
-        concat_list.unlink()
-    except OSError:
-        pass
-
     if result.returncode != 0:
-        print(f"  WARNING: ffmpeg concat error: {result.stderr[-200:]}")
+        print(f"  WARNING: ffmpeg PCM encode error: {result.stderr[-200:]}")
 
 
 def _strip_tags(script_text):
     """Remove [CHYRON: ...], [B-ROLL: ...] tags and markdown, leaving spoken text."""
-    cleaned = re.sub(r'\[CHYRON:\s*[^\]]+\]', '', script_text)
-    cleaned = re.sub(r'\[B-ROLL:\s*[^\]]+\]', '', cleaned)
-    cleaned = re.sub(r'\*\*([^*]+)\*\*', r'\1', cleaned)
-    cleaned = re.sub(r'\*([^*]+)\*', r'\1', cleaned)
-    cleaned = re.sub(r'^#+\s*', '', cleaned, flags=re.MULTILINE)
-    cleaned = re.sub(r'^[-*]\s+', '', cleaned, flags=re.MULTILINE)
-    cleaned = re.sub(r'^[A-Z][A-Za-z\s]+:\s*', '', cleaned)
-    cleaned = re.sub(r'\n\s*\n', '\n\n', cleaned)
+    cleaned = script_text
+    # Tag and emphasis passes only when their bracket/asterisk is present
+    if '[' in cleaned:
+        cleaned = _VISUAL_TAG_RE.sub('', cleaned)
+    if '*' in cleaned:
+        cleaned = _BOLD_RE.sub(r'\1', cleaned)
+        cleaned = _ITALIC_RE.sub(r'\1', cleaned)
+    cleaned = _HEADING_RE.sub('', cleaned)
+    cleaned = _BULLET_RE.sub('', cleaned)
+    cleaned = _SPEAKER_RE.sub('', cleaned)
+    cleaned = _BLANK_LINES_RE.sub('\n\n', cleaned)
     return cleaned.strip()
 
 
 def _measure_duration(audio_path):
-    """Use ffprobe to measure audio duration in seconds."""
+    """Measure audio duration in seconds (mutagen if installed, else ffprobe)."""
+    if MP3 is not None:
+        try:
+            return MP3(audio_path).info.length
+        except Exception:
+            pass
     try:
         result = subprocess.run(
             [
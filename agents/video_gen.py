@@ -5,14 +5,37 @@ Produces 720p MP4 video of an anchor reading the hourly summary script.
 The avatar's voice is linked to ElevenLabs in HeyGen, so we only send text.
 """
 
+import os
+import random
 import re
+import shutil
 import time
 import requests
+import urllib3
 from pathlib import Path
+from requests.adapters import HTTPAdapter
 
-# Polling configuration
-POLL_INTERVAL_SECONDS = 15
-MAX_POLL_ATTEMPTS = 80  # 80 * 15s = 20 minutes max wait
+# Polling configuration: exponential backoff between status checks
+POLL_INITIAL_SECONDS = 4
+POLL_MAX_INTERVAL_SECONDS = 20
+POLL_BACKOFF = 1.5
+MAX_POLL_SECONDS = 1200  # 20 minutes max wait
+
+# Video download copy size
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Shared keep-alive session: submit, status polls and the download reuse
+# TCP/TLS connections instead of a fresh handshake per request.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# Script cleanup patterns, applied in this order by _clean_script_for_video
+# (anchor, chyron and b-roll tags are all dropped in one pass)
+_TAG_RE = re.compile(r'\[ANCHOR_[AB]\]\s*|\[(?:CHYRON|B-ROLL):\s*[^\]]+\]')
+_BOLD_RE = re.compile(r'\*\*([^*]+)\*\*')
+_ITALIC_RE = re.compile(r'\*([^*]+)\*')
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+_MULTI_SPACE_RE = re.compile(r'  +')
 
 
 def generate_video(summary_data, config):
@@ -113,17 +136,16 @@ def _clean_script_for_video(script_text):
         return ""
 
     cleaned = script_text
-    # Remove anchor tags
-    cleaned = re.sub(r'\[ANCHOR_[AB]\]\s*', '', cleaned)
-    # Remove chyron/broll tags
-    cleaned = re.sub(r'\[CHYRON:\s*[^\]]+\]', '', cleaned)
-    cleaned = re.sub(r'\[B-ROLL:\s*[^\]]+\]', '', cleaned)
+    # Remove anchor and chyron/broll tags (skip the scan when there are none)
+    if '[' in cleaned:
+        cleaned = _TAG_RE.sub('', cleaned)
     # Remove markdown bold/italic
-    cleaned = re.sub(r'\*\*([^*]+)\*\*', r'\1', cleaned)
-    cleaned = re.sub(r'\*([^*]+)\*', r'\1', cleaned)
+    if '*' in cleaned:
+        cleaned = _BOLD_RE.sub(r'\1', cleaned)
+        cleaned = _ITALIC_RE.sub(r'\1', cleaned)
     # Normalize whitespace
-    cleaned = re.sub(r'\n\s*\n', '\n\n', cleaned)
-    cleaned = re.sub(r'  +', ' ', cleaned)
+    cleaned = _BLANK_LINES_RE.sub('\n\n', cleaned)
+    cleaned = _MULTI_SPACE_RE.sub(' ', cleaned)
     return cleaned.strip()
 
 
@@ -134,7 +156,7 @@ def _submit_video(api_key, avatar_id, script_text, dimension, voice_id):
     Returns the video_id or None on failure.
     """
     try:
-        response = requests.post(
+        response = _SESSION.post(
             "https://api.heygen.com/v2/video/generate",
             headers={
                 "X-Api-Key": api_key,
@@ -183,12 +205,20 @@ def _poll_video_status(api_key, video_id):
     """
     Poll HeyGen video status until completion.
 
+    Polls back off exponentially (with jitter) from POLL_INITIAL_SECONDS to
+    POLL_MAX_INTERVAL_SECONDS, so short renders are picked up quickly while
+    the total wait stays bounded by MAX_POLL_SECONDS.
+
     Returns the video download URL or None on failure/timeout.
     """
-    for attempt in range(MAX_POLL_ATTEMPTS):
+    start = time.monotonic()
+    next_log = 0
+    attempt = 0
+    while True:
         try:
-            response = requests.get(
-                f"https://api.heygen.com/v1/video_status.get?video_id={video_id}",
+            response = _SESSION.get(
+                "https://api.heygen.com/v1/video_status.get",
+                params={"video_id": video_id},
                 headers={"X-Api-Key": api_key},
                 timeout=15,
             )
@@ -199,8 +229,7 @@ def _poll_video_status(api_key, video_id):
             if status == "completed":
                 video_url = data.get("video_url")
                 if video_url:
-                    elapsed = (attempt + 1) * POLL_INTERVAL_SECONDS
-                    print(f"  HeyGen video ready ({elapsed}s)")
+                    print(f"  HeyGen video ready ({time.monotonic() - start:.0f}s)")
                     return video_url
                 else:
                     print("  WARNING: HeyGen completed but no video_url in response")
@@ -212,35 +241,56 @@ def _poll_video_status(api_key, video_id):
                 return None
 
             elif status in ("processing", "pending", "waiting"):
-                if attempt % 4 == 0:  # Log every ~60 seconds
-                    elapsed = (attempt + 1) * POLL_INTERVAL_SECONDS
-                    print(f"  HeyGen: {status}... ({elapsed}s elapsed)")
-                time.sleep(POLL_INTERVAL_SECONDS)
+                elapsed = time.monotonic() - start
+                if elapsed >= next_log:  # Log every ~60 seconds
+                    print(f"  HeyGen: {status}... ({elapsed:.0f}s elapsed)")
+                    next_log = elapsed + 60
 
             else:
                 print(f"  WARNING: Unknown HeyGen status '{status}', continuing to poll...")
-                time.sleep(POLL_INTERVAL_SECONDS)
 
         except requests.exceptions.RequestException as e:
             print(f"  WARNING: HeyGen poll error (attempt {attempt + 1}): {e}")
-            time.sleep(POLL_INTERVAL_SECONDS)
 
-    elapsed = MAX_POLL_ATTEMPTS * POLL_INTERVAL_SECONDS
-    print(f"  WARNING: HeyGen video timed out after {elapsed}s ({MAX_POLL_ATTEMPTS} attempts)")
+        delay = min(POLL_MAX_INTERVAL_SECONDS, POLL_INITIAL_SECONDS * POLL_BACKOFF ** attempt)
+        delay += random.uniform(0, 1)
+        if time.monotonic() - start + delay > MAX_POLL_SECONDS:
+            break
+        time.sleep(delay)
+        attempt += 1
+
+    elapsed = time.monotonic() - start
+    print(f"  WARNING: HeyGen video timed out after {elapsed:.0f}s ({attempt + 1} attempts)")
     return None
 
 
 def _download_video(url, output_path):
-    """Download the video file from HeyGen's URL."""
-    try:
-        response = requests.get(url, timeout=120, stream=True)
-        response.raise_for_status()
+    """
+    Download the video file from HeyGen's URL.
 
-        with open(output_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+    The body is written to a .part file that is renamed into place once
+    complete, so an interrupted download never leaves a truncated .mp4.
+    """
+    part_path = f"{output_path}.part"
+    try:
+        with _SESSION.get(url, timeout=120, stream=True) as response:
+            response.raise_for_status()
+            # Copy the raw stream in C, 1 MiB at a time (undoing any
+            # Content-Encoding as iter_content would)
+            response.raw.decode_content = True
+            with open(part_path, "wb") as f:
+                shutil.copyfileobj(response.raw, f, length=_DOWNLOAD_CHUNK_SIZE)
+        os.replace(part_path, output_path)
 
         return True
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError, OSError) as e:
+        # Reading response.raw directly surfaces dropped connections and read
+        # timeouts as urllib3 errors rather than requests exceptions
         print(f"  WARNING: Video download failed: {e}")
         return False
+    finally:
+        if os.path.lexists(part_path):
+            try:
+                os.remove(part_path)
+            except OSError:
+                pass
@@ -6,17 +6,119 @@ chyron tags and B-roll descriptions. All content is fictional but
 designed to be indistinguishable from real local/national news.
 """
 
-import anthropic
+import asyncio
+import functools
+import hashlib
 import json
 import random
 import re
 import uuid
+from collections import OrderedDict
+
+from agents.clients import get_async_client, get_client
+from agents.nonsense import inject_nonsense
+from agents.style_memory import load_style_context
 
 
 # Word count targets
 MIN_WORDS = 60
 MAX_WORDS = 75
 MAX_RETRIES = 3
+# A streamed draft that passes MAX_WORDS by this many spoken words is cut
+# off and retried (the margin covers a [TAG: ...] still being streamed)
+STREAM_ABORT_MARGIN = 10
+
+# Drafts requested at once by generate_script_async()
+SPECULATIVE_ATTEMPTS = 2
+
+SCRIPT_MODEL = "claude-sonnet-4-20250514"
+# Model for length-correction retries (config: apis.anthropic_retry_model);
+# a retry only has to hit the word count, so a faster, cheaper model does
+RETRY_MODEL = "claude-haiku-4-5-20251001"
+
+# In-process LRU of accepted drafts (script text, spoken word count), keyed
+# by a hash of the exact request (config: cache.script_responses entries,
+# 0 disables). Post-processing still runs on a hit, so each story gets a
+# fresh story_id and nonsense roll.
+_response_cache = OrderedDict()
+response_cache_stats = {"hits": 0, "misses": 0}
+
+_SYSTEM_MSG = """You are a television news script writer. You write extremely concise broadcast copy. Every word must earn its place. You never exceed the word count you are given. You write in plain text only — no markdown, no formatting, no character names as prefixes."""
+
+# Static script instructions, identical for every story (sent as a cached
+# system block; see generate_script)
+_SCRIPT_RULES = """BLUEPRINT USAGE — CRITICAL:
+Pick ONE blueprint from the request and write a story that CLOSELY mirrors its structure, framing, and specificity level. Keep similar numbers, similar institutional actors, and the same geographic scope — but change ALL names of people, companies, and specific organizations to FICTIONAL ones. The story should read like a parallel-universe version of the real headline. Someone who read the real news today should think "that sounds vaguely familiar but different."
+
+HARD REQUIREMENTS:
+- EXACTLY 60 to 75 spoken words. Not 76. Not 100. Count carefully.
+- Tags like [CHYRON: ...] and [B-ROLL: ...] do NOT count toward the word limit.
+- Cover ONE story. One angle. No pivoting to a second story.
+- End with a natural anchor sign-off: a toss to break, a tease of what's ahead, or a simple "more on this as it develops" style line. Keep it under 10 words.
+
+CONTENT RULES:
+- Deadpan. No humor, no irony.
+- You MAY use real US places, real federal agencies (EPA, FBI, FEMA, etc.), real political parties.
+- Use places and storylines from the world context, or invent entirely new ones.
+- One [CHYRON: text] tag and one [B-ROLL: description] tag, placed inline where they'd appear on screen.
+- No markdown. No bold. No anchor name prefix. Just the spoken script with inline tags.
+
+*** NO REAL NAMES — THIS IS ABSOLUTELY CRITICAL ***
+Every single person named in your script MUST be fictional. Every company MUST be fictional.
+- NO real politicians: not Marco Rubio, not Mitch McConnell, not Chuck Schumer, not Nancy Pelosi, not any real senator, cabinet member, or governor. INVENT a name.
+- NO real sitting officials: instead of "Secretary of State Marco Rubio" → use "Secretary of State [fictional name]" like "Secretary of State Diane Mercer".
+- For the President or VP, do NOT name them — just say "the President", "the White House", "the administration".
+- NO real companies: not Boeing, not Amazon, not Google, not Tesla, not Meta, not Apple, not ExxonMobil, not any real corporation. INVENT a company name.
+  Instead of "Boeing 737" → "Meridian Aerospace 700". Instead of "Amazon warehouse" → "Crestline Logistics facility".
+- NO real celebrities, CEOs, journalists, or public figures of any kind.
+- If you're unsure whether a name is real, INVENT a new one. It is always safer to invent.
+- The ONLY real-world proper nouns allowed are: place names (cities, states, countries), government agency names (FBI, EPA), political party names (Democrat, Republican), and institutional roles (President, Senator, Governor).
+
+STORY TYPE VARIETY — IMPORTANT:
+Not every story is an investigation or a federal probe. Real news desks cover a wide range. Choose ONE of these story types at random:
+- HARD NEWS: breaking events, accidents, natural disasters, political votes, court rulings
+- ECONOMICS: market moves, layoffs, company earnings, housing data, trade disputes, inflation reports
+- TECHNOLOGY: product launches, data breaches, AI developments, social media policy, startup failures
+- INTERNATIONAL: diplomatic tensions, foreign elections, refugee situations, trade deals, military postures
+- HEALTH/SCIENCE: disease outbreaks, drug approvals, research findings, hospital closures, clinical trials
+- EDUCATION: school board fights, university scandals, testing policy changes, teacher strikes
+- WEATHER/ENVIRONMENT: severe storms, drought, flooding, wildfire, seasonal anomalies
+- FLUFF/HUMAN INTEREST: local record-breakers, animal rescues, community events, quirky milestones, charity drives
+- SPORTS: team relocations, player suspensions, stadium deals, league disputes, doping scandals
+Do NOT write another "federal agency probes/raids/investigates" story unless that's truly the best fit. Vary the verbs too — not everything is a probe.
+
+CAPITALIZATION — MANDATORY:
+- ALL acronyms must be fully capitalized: EPA, FBI, FEMA, DHS, FAA, NLRB, ACLU, NATO, FDA, CDC, DOD, DOE, HUD, SEC, etc.
+- ALL country names must be properly capitalized: United States, South Korea, North Korea, China, Russia, Ukraine, Israel, Iran, etc.
+- ALL proper nouns (city names, state names, agency names, organization names) must be correctly capitalized.
+- This is broadcast copy — proper capitalization is non-negotiable.
+
+EXAMPLE of correct length and format (68 words — note ALL names are fictional):
+Good evening. A federal grand jury in Atlanta has returned a twelve-count indictment against three former executives of Rayburn Holdings, alleging wire fraud and securities manipulation totaling more than two hundred million dollars. Lead prosecutor Anna Whitmore confirmed the charges this afternoon, calling it one of the largest corporate fraud cases in the Southeast. [CHYRON: ATLANTA GRAND JURY INDICTS RAYBURN EXECS] [B-ROLL: Federal courthouse exterior, attorneys exiting building] Bail hearings are set for Friday. We'll continue to follow this.
+Notice: "Rayburn Holdings" is a FICTIONAL company. "Anna Whitmore" is a FICTIONAL person. This is required."""
+
+# Text of the first (cached) system block
+_SYSTEM_TEXT = f"{_SYSTEM_MSG}\n\n{_SCRIPT_RULES}"
+
+# Per-story user message, filled by _prepare_script_request via format_map
+_PROMPT_TEMPLATE = """Write a single anchor read for This News Now (TNN).
+
+NEWS REGISTER: {register}
+TRENDING: {trending}
+TONE: {tone}
+TOPIC WEIGHTS: {topic_weights}
+{blueprint_block}{style_context}{diversity_block}
+
+ANCHOR: {anchor_name} ({anchor_gender})
+
+NOW WRITE YOUR SCRIPT:"""
+
+_DIVERSITY_TEMPLATE = """
+
+DIVERSITY REQUIREMENT — CRITICAL:
+This batch has already covered these topics/subjects: {covered}
+You MUST choose a COMPLETELY DIFFERENT topic, location, and angle. Do NOT repeat or revisit any of the above subjects.
+Pick from underrepresented categories: politics, international, science, crime, health, education, technology, business, weather, military, or sports."""
 
 
 def _select_blueprints(blueprints, topics_covered=None):
@@ -69,7 +171,7 @@ def _select_blueprints(blueprints, topics_covered=None):
     return selected
 
 
-def generate_script(config, world_bible, news_context, topics_covered=None):
+def generate_script(config, world_bible, news_context, topics_covered=None, client=None):
     """
     Generate a single anchor script using Claude.
     Retries if word count is outside 60-75 range.
@@ -79,6 +181,8 @@ def generate_script(config, world_bible, news_context, topics_covered=None):
         world_bible: world bible dict
         news_context: scraped news context
         topics_covered: list of topic strings already generated this batch (for diversity)
+        client: optional anthropic.Anthropic client to use (defaults to a
+            shared client for the configured API key)
 
     Returns a dict with:
         - script: full anchor script text
@@ -90,8 +194,113 @@ def generate_script(config, world_bible, news_context, topics_covered=None):
         - story_id: unique ID
         - word_count: actual spoken word count
     """
-    client = anthropic.Anthropic(api_key=config["apis"]["anthropic_key"])
+    request = _prepare_script_request(config, world_bible, news_context, topics_covered)
+    if client is None:
+        client = get_client(config["apis"]["anthropic_key"])
+    cached = _load_cached_draft(request)
+    if cached is not None:
+        return _finish_script(*cached, None, request, config)
+    prompt = request["prompt"]
+
+    # Try up to MAX_RETRIES times to get a script within word count
+    for attempt in range(MAX_RETRIES):
+        # Earlier attempts stop streaming once clearly too long; the final
+        # attempt always runs to completion since its text is kept as-is
+        abort_over = MAX_WORDS + STREAM_ABORT_MARGIN if attempt < MAX_RETRIES - 1 else None
+        model = SCRIPT_MODEL if attempt == 0 else request["retry_model"]
+        message, script_text = _stream_draft(client, _message_params(request, prompt, model), abort_over)
+        spoken_words = _count_spoken_words(script_text)
+
+        if MIN_WORDS <= spoken_words <= MAX_WORDS:
+            break
+        elif attempt < MAX_RETRIES - 1:
+            print(f"  Retry {attempt + 1}: got {spoken_words} words (need {MIN_WORDS}-{MAX_WORDS})")
+            # Adjust prompt hint for retry
+            prompt += _retry_hint(spoken_words)
+        else:
+            print(f"  Warning: final attempt got {spoken_words} words (target {MIN_WORDS}-{MAX_WORDS})")
+
+    # Only a first-attempt draft answers the request the cache key hashes
+    # (retries use retry_model and a hinted prompt)
+    if attempt == 0:
+        _store_cached_draft(request, script_text, spoken_words)
+    return _finish_script(script_text, spoken_words, message, request, config)
+
+
+async def generate_script_async(config, world_bible, news_context, topics_covered=None, client=None):
+    """
+    Async variant of generate_script().
+
+    Sends SPECULATIVE_ATTEMPTS identical requests at once on an
+    AsyncAnthropic client and keeps the first (in request order) whose
+    word count is in range, so an out-of-range draft costs no extra round
+    trip. Only if none qualify is one more attempt made, with the usual
+    length hint. Uses up to MAX_RETRIES calls in total, like the sync path.
+    Takes the same arguments (client, if given, must be an AsyncAnthropic
+    client) and returns the same dict.
+    """
+    request = _prepare_script_request(config, world_bible, news_context, topics_covered)
+    cached = _load_cached_draft(request)
+    if cached is not None:
+        return _finish_script(*cached, None, request, config)
+    if client is None:
+        client = get_async_client(config["apis"]["anthropic_key"])
+    params = _message_params(request, request["prompt"])
+
+    messages = await asyncio.gather(*(
+        client.messages.create(**params) for _ in range(SPECULATIVE_ATTEMPTS)
+    ))
+    drafts = [(m, m.content[0].text.strip()) for m in messages]
+    counts = [_count_spoken_words(text) for _, text in drafts]
+    for (message, script_text), spoken_words in zip(drafts, counts):
+        if MIN_WORDS <= spoken_words <= MAX_WORDS:
+            _store_cached_draft(request, script_text, spoken_words)
+            break
+    else:
+        print(f"  Retry: got {counts} words (need {MIN_WORDS}-{MAX_WORDS})")
+        prompt = request["prompt"] + _retry_hint(counts[0])
+        message = await client.messages.create(**_message_params(request, prompt, request["retry_model"]))
+        script_text = message.content[0].text.strip()
+        spoken_words = _count_spoken_words(script_text)
+        if not MIN_WORDS <= spoken_words <= MAX_WORDS:
+            print(f"  Warning: final attempt got {spoken_words} words (target {MIN_WORDS}-{MAX_WORDS})")
+
+    return _finish_script(script_text, spoken_words, message, request, config)
+
+
+def _stream_draft(client, params, abort_over=None):
+    """
+    Stream one draft, returning (message, stripped script text).
 
+    If abort_over is set, the stream is closed as soon as the partial
+    draft has more spoken words than that, and the returned message is
+    the snapshot so far (its usage still reports prompt cache hits).
+    """
+    with client.messages.stream(**params) as stream:
+        parts = []
+        # Every new word needs at least one new character, so the draft
+        # can't pass abort_over until it has grown by (abort_over - words)
+        # characters; recount only then instead of on every delta.
+        length = next_check = 0
+        for text in stream.text_stream:
+            parts.append(text)
+            length += len(text)
+            if abort_over is None or length < next_check:
+                continue
+            draft = "".join(parts)
+            words = _count_spoken_words(draft)
+            if words > abort_over:
+                return stream.current_message_snapshot, draft.strip()
+            next_check = length + abort_over - words + 1
+        message = stream.get_final_message()
+    return message, message.content[0].text.strip()
+
+
+def _prepare_script_request(config, world_bible, news_context, topics_covered=None):
+    """
+    Pick the anchor and build the cached system blocks + per-story prompt.
+    Returns a request dict consumed by _message_params() and _finish_script().
+    """
     # Pick a random anchor (skip paused ones)
     active_anchors = [a for a in world_bible["anchors"] if not a.get("paused", False)]
     anchor = random.choice(active_anchors if active_anchors else world_bible["anchors"])
@@ -104,12 +313,11 @@ def generate_script(config, world_bible, news_context, topics_covered=None):
     tone = dials.get("tone", "concerned")
     topic_weights = dials.get("topic_weights", {})
 
-    system_msg = """You are a television news script writer. You write extremely concise broadcast copy. Every word must earn its place. You never exceed the word count you are given. You write in plain text only — no markdown, no formatting, no character names as prefixes."""
-
     # Build blueprint block from rich scraped data
     blueprints = news_context.get("story_blueprints", [])
     conflict_types = news_context.get("conflict_types", [])
     blueprint_block = ""
+    selected = []
     if blueprints:
         selected = _select_blueprints(blueprints, topics_covered)
         if selected:
@@ -139,9 +347,7 @@ def generate_script(config, world_bible, news_context, topics_covered=None):
     # Pull accumulated style knowledge if available
     style_context = ""
     try:
-        from agents.style_memory import load_style_library, get_style_context_for_writer
-        style_lib = load_style_library()
-        style_context = get_style_context_for_writer(style_lib)
+        style_context = load_style_context()
         if style_context:
             style_context = f"\n\n{style_context}"
     except Exception:
@@ -150,102 +356,123 @@ def generate_script(config, world_bible, news_context, topics_covered=None):
     # Build diversity block if we've already covered topics
     diversity_block = ""
     if topics_covered:
-        covered_str = ", ".join(topics_covered)
-        diversity_block = f"""
-
-DIVERSITY REQUIREMENT — CRITICAL:
-This batch has already covered these topics/subjects: {covered_str}
-You MUST choose a COMPLETELY DIFFERENT topic, location, and angle. Do NOT repeat or revisit any of the above subjects.
-Pick from underrepresented categories: politics, international, science, crime, health, education, technology, business, weather, military, or sports."""
+        diversity_block = _DIVERSITY_TEMPLATE.format(covered=", ".join(topics_covered))
+
+    # Everything that doesn't change between stories lives in the system
+    # blocks, marked for prompt caching: the instructions + rules, then the
+    # world summary. Only the per-story context goes in the user message.
+    system_blocks = [
+        {"type": "text", "text": _SYSTEM_TEXT,
+         "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": f"WORLD CONTEXT:\n{world_summary}",
+         "cache_control": {"type": "ephemeral"}},
+    ]
 
-    prompt = f"""Write a single anchor read for This News Now (TNN).
+    prompt = _PROMPT_TEMPLATE.format_map({
+        "register": news_context.get('register', 'tense'),
+        "trending": ', '.join(news_context.get('trending_topics', ['politics', 'economy'])),
+        "tone": tone,
+        "topic_weights": _topic_weights_json(topic_weights),
+        "blueprint_block": blueprint_block,
+        "style_context": style_context,
+        "diversity_block": diversity_block,
+        "anchor_name": anchor['name'],
+        "anchor_gender": anchor['gender'],
+    })
+
+    return {
+        "anchor": anchor,
+        "system_blocks": system_blocks,
+        "prompt": prompt,
+        "topic_weights": topic_weights,
+        "selected_blueprints": selected,
+        "cache_size": config.get("cache", {}).get("script_responses", 0),
+        "retry_model": config.get("apis", {}).get("anthropic_retry_model", RETRY_MODEL),
+    }
 
-WORLD CONTEXT:
-{world_summary}
 
-NEWS REGISTER: {news_context.get('register', 'tense')}
-TRENDING: {', '.join(news_context.get('trending_topics', ['politics', 'economy']))}
-TONE: {tone}
-TOPIC WEIGHTS: {json.dumps(topic_weights)}
-{blueprint_block}{style_context}{diversity_block}
+def _message_params(request, prompt, model=SCRIPT_MODEL):
+    """Keyword arguments for messages.create() for a prepared script request."""
+    return {
+        "model": model,
+        "max_tokens": 512,
+        "system": request["system_blocks"],
+        "messages": [{"role": "user", "content": prompt}],
+    }
 
-BLUEPRINT USAGE — CRITICAL:
-Pick ONE blueprint above and write a story that CLOSELY mirrors its structure, framing, and specificity level. Keep similar numbers, similar institutional actors, and the same geographic scope — but change ALL names of people, companies, and specific organizations to FICTIONAL ones. The story should read like a parallel-universe version of the real headline. Someone who read the real news today should think "that sounds vaguely familiar but different."
 
-HARD REQUIREMENTS:
-- EXACTLY 60 to 75 spoken words. Not 76. Not 100. Count carefully.
-- Tags like [CHYRON: ...] and [B-ROLL: ...] do NOT count toward the word limit.
-- Cover ONE story. One angle. No pivoting to a second story.
-- End with a natural anchor sign-off: a toss to break, a tease of what's ahead, or a simple "more on this as it develops" style line. Keep it under 10 words.
+def _topic_weights_json(topic_weights):
+    """JSON for the TOPIC WEIGHTS prompt line, serialized once per distinct weights."""
+    try:
+        return _topic_weights_json_cached(tuple(topic_weights.items()))
+    except TypeError:  # unhashable weight values
+        return json.dumps(topic_weights)
 
-ANCHOR: {anchor['name']} ({anchor['gender']})
 
-CONTENT RULES:
-- Deadpan. No humor, no irony.
-- You MAY use real US places, real federal agencies (EPA, FBI, FEMA, etc.), real political parties.
-- Use places and storylines from the world context, or invent entirely new ones.
-- One [CHYRON: text] tag and one [B-ROLL: description] tag, placed inline where they'd appear on screen.
-- No markdown. No bold. No anchor name prefix. Just the spoken script with inline tags.
+@functools.lru_cache(maxsize=8)
+def _topic_weights_json_cached(items):
+    return json.dumps(dict(items))
 
-*** NO REAL NAMES — THIS IS ABSOLUTELY CRITICAL ***
-Every single person named in your script MUST be fictional. Every company MUST be fictional.
-- NO real politicians: not Marco Rubio, not Mitch McConnell, not Chuck Schumer, not Nancy Pelosi, not any real senator, cabinet member, or governor. INVENT a name.
-- NO real sitting officials: instead of "Secretary of State Marco Rubio" → use "Secretary of State [fictional name]" like "Secretary of State Diane Mercer".
-- For the President or VP, do NOT name them — just say "the President", "the White House", "the administration".
-- NO real companies: not Boeing, not Amazon, not Google, not Tesla, not Meta, not Apple, not ExxonMobil, not any real corporation. INVENT a company name.
-  Instead of "Boeing 737" → "Meridian Aerospace 700". Instead of "Amazon warehouse" → "Crestline Logistics facility".
-- NO real celebrities, CEOs, journalists, or public figures of any kind.
-- If you're unsure whether a name is real, INVENT a new one. It is always safer to invent.
-- The ONLY real-world proper nouns allowed are: place names (cities, states, countries), government agency names (FBI, EPA), political party names (Democrat, Republican), and institutional roles (President, Senator, Governor).
-
-STORY TYPE VARIETY — IMPORTANT:
-Not every story is an investigation or a federal probe. Real news desks cover a wide range. Choose ONE of these story types at random:
-- HARD NEWS: breaking events, accidents, natural disasters, political votes, court rulings
-- ECONOMICS: market moves, layoffs, company earnings, housing data, trade disputes, inflation reports
-- TECHNOLOGY: product launches, data breaches, AI developments, social media policy, startup failures
-- INTERNATIONAL: diplomatic tensions, foreign elections, refugee situations, trade deals, military postures
-- HEALTH/SCIENCE: disease outbreaks, drug approvals, research findings, hospital closures, clinical trials
-- EDUCATION: school board fights, university scandals, testing policy changes, teacher strikes
-- WEATHER/ENVIRONMENT: severe storms, drought, flooding, wildfire, seasonal anomalies
-- FLUFF/HUMAN INTEREST: local record-breakers, animal rescues, community events, quirky milestones, charity drives
-- SPORTS: team relocations, player suspensions, stadium deals, league disputes, doping scandals
-Do NOT write another "federal agency probes/raids/investigates" story unless that's truly the best fit. Vary the verbs too — not everything is a probe.
-
-CAPITALIZATION — MANDATORY:
-- ALL acronyms must be fully capitalized: EPA, FBI, FEMA, DHS, FAA, NLRB, ACLU, NATO, FDA, CDC, DOD, DOE, HUD, SEC, etc.
-- ALL country names must be properly capitalized: United States, South Korea, North Korea, China, Russia, Ukraine, Israel, Iran, etc.
-- ALL proper nouns (city names, state names, agency names, organization names) must be correctly capitalized.
-- This is broadcast copy — proper capitalization is non-negotiable.
 
-EXAMPLE of correct length and format (68 words — note ALL names are fictional):
-Good evening. A federal grand jury in Atlanta has returned a twelve-count indictment against three former executives of Rayburn Holdings, alleging wire fraud and securities manipulation totaling more than two hundred million dollars. Lead prosecutor Anna Whitmore confirmed the charges this afternoon, calling it one of the largest corporate fraud cases in the Southeast. [CHYRON: ATLANTA GRAND JURY INDICTS RAYBURN EXECS] [B-ROLL: Federal courthouse exterior, attorneys exiting building] Bail hearings are set for Friday. We'll continue to follow this.
-Notice: "Rayburn Holdings" is a FICTIONAL company. "Anna Whitmore" is a FICTIONAL person. This is required.
+def _draft_cache_key(request):
+    """
+    Hash of everything sent to the model for a prepared script request's
+    first attempt (SCRIPT_MODEL, unhinted prompt).
+    """
+    key = hashlib.blake2b(digest_size=16)
+    for part in [SCRIPT_MODEL] + [block["text"] for block in request["system_blocks"]] + [request["prompt"]]:
+        key.update(part.encode("utf-8"))
+        key.update(b"\0")
+    return key.hexdigest()
+
+
+def _load_cached_draft(request):
+    """Return a cached (script_text, spoken_words) for this exact request, or None."""
+    if not request.get("cache_size"):
+        return None
+    key = _draft_cache_key(request)
+    cached = _response_cache.get(key)
+    if cached is None:
+        response_cache_stats["misses"] += 1
+        return None
+    _response_cache.move_to_end(key)
+    response_cache_stats["hits"] += 1
+    print("  Script: response cache hit, skipping Claude call")
+    return cached
+
+
+def _store_cached_draft(request, script_text, spoken_words):
+    """
+    Remember an in-range first-attempt draft for this request, evicting the
+    oldest entries.
+    """
+    cache_size = request.get("cache_size")
+    if not cache_size or not MIN_WORDS <= spoken_words <= MAX_WORDS:
+        return
+    key = _draft_cache_key(request)
+    _response_cache[key] = (script_text, spoken_words)
+    _response_cache.move_to_end(key)
+    while len(_response_cache) > cache_size:
+        _response_cache.popitem(last=False)
 
-NOW WRITE YOUR SCRIPT:"""
 
-    # Try up to MAX_RETRIES times to get a script within word count
-    for attempt in range(MAX_RETRIES):
-        message = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=512,
-            system=system_msg,
-            messages=[{"role": "user", "content": prompt}],
-        )
+def _retry_hint(spoken_words):
+    """Prompt addendum steering a retry back into the word-count range."""
+    if spoken_words > MAX_WORDS:
+        return f"\n\nYour previous attempt was {spoken_words} words. That is too long. Cut it down to 65 words maximum. Be ruthless — remove adjectives, combine sentences, shorten the sign-off."
+    return f"\n\nYour previous attempt was only {spoken_words} words. Add one more detail to reach at least {MIN_WORDS} words."
 
-        script_text = message.content[0].text.strip()
-        spoken_words = _count_spoken_words(script_text)
 
-        if MIN_WORDS <= spoken_words <= MAX_WORDS:
-            break
-        elif attempt < MAX_RETRIES - 1:
-            print(f"  Retry {attempt + 1}: got {spoken_words} words (need {MIN_WORDS}-{MAX_WORDS})")
-            # Adjust prompt hint for retry
-            if spoken_words > MAX_WORDS:
-                prompt += f"\n\nYour previous attempt was {spoken_words} words. That is too long. Cut it down to 65 words maximum. Be ruthless — remove adjectives, combine sentences, shorten the sign-off."
-            else:
-                prompt += f"\n\nYour previous attempt was only {spoken_words} words. Add one more detail to reach at least {MIN_WORDS} words."
-        else:
-            print(f"  Warning: final attempt got {spoken_words} words (target {MIN_WORDS}-{MAX_WORDS})")
+def _finish_script(script_text, spoken_words, message, request, config):
+    """
+    Post-process the chosen draft into the final script dict: capitalization
+    + real-name scrub, nonsense injection, tag parsing, topic and blueprint.
+    message is the API response the draft came from (None for a cached draft).
+    """
+    anchor = request["anchor"]
+    topic_weights = request["topic_weights"]
+    selected = request["selected_blueprints"]
+    cached_tokens = getattr(getattr(message, "usage", None), "cache_read_input_tokens", 0) or 0
 
     # Fix capitalization of acronyms and proper nouns
     script_text = _fix_capitalization(script_text)
@@ -254,26 +481,22 @@ NOW WRITE YOUR SCRIPT:"""
     script_text = _scrub_real_names(script_text)
 
     # Nonsense injection (post-processing, after word count is validated)
-    from agents.nonsense import inject_nonsense
     script_text, injected, fragment = inject_nonsense(script_text, config)
     if injected:
         print(f"  \u2726 Nonsense injected: '{fragment}'")
 
     # Parse chyrons and B-roll from the script
-    chyrons = _extract_tags(script_text, "CHYRON")
-    broll_descriptions = _extract_tags(script_text, "B-ROLL")
+    tags = _extract_all_tags(script_text)
+    chyrons = tags.get("CHYRON", [])
+    broll_descriptions = tags.get("B-ROLL", [])
 
     # Determine topic from script content
     topic = _classify_topic(script_text, topic_weights)
 
-    story_id = str(uuid.uuid4())[:8]
+    story_id = uuid.uuid4().hex[:8]
 
     # Track which blueprint inspired this story
-    inspiration = None
-    if blueprints:
-        selected = _select_blueprints(blueprints, topics_covered)
-        if selected:
-            inspiration = selected[0].get("headline_frame")
+    inspiration = selected[0].get("headline_frame") if selected else None
 
     script_data = {
         "script": script_text,
@@ -289,19 +512,44 @@ NOW WRITE YOUR SCRIPT:"""
         "inspiration_blueprint": inspiration,
     }
 
-    print(f"  Script generated: [{topic}] {spoken_words}w — {chyrons[0] if chyrons else 'No chyron'}")
+    cache_note = f" (prompt cache: {cached_tokens} tokens)" if cached_tokens else ""
+    print(f"  Script generated: [{topic}] {spoken_words}w — {chyrons[0] if chyrons else 'No chyron'}{cache_note}")
     return script_data
 
 
+# [TAG: ...] markers (chyrons, b-roll, etc.) that are not read aloud
+_TAG_STRIPPER = re.compile(r'\[[A-Z_-]+:\s*[^\]]+\]')
+
+# Any [TAG: content] marker, captured as (tag name, content)
+_ALL_TAGS_RE = re.compile(r'\[([A-Z][A-Z_-]*):\s*(.+?)\]', re.IGNORECASE)
+
+
 def _count_spoken_words(script_text):
     """Count only spoken words, excluding [TAG: ...] content."""
-    cleaned = re.sub(r'\[[A-Z_-]+:\s*[^\]]+\]', '', script_text)
+    # Skip the tag scan when there are none (e.g. early in a streamed draft)
+    cleaned = _TAG_STRIPPER.sub('', script_text) if '[' in script_text else script_text
     words = cleaned.split()
     return len(words)
 
 
+# Last (world_bible, summary) built. Holding the dict itself keeps the
+# identity check sound (its id can't be reused while cached); the world
+# bible is loaded once per run and never mutated.
+_world_summary_cache = (None, None)
+
+
 def _build_world_summary(world_bible):
-    """Build a concise world bible summary for prompt injection."""
+    """Build a concise world bible summary for prompt injection.
+
+    The result is cached per world_bible dict, so every script in a batch
+    gets a byte-identical WORLD CONTEXT block (which keeps the prompt cache
+    hitting) without rebuilding it.
+    """
+    global _world_summary_cache
+    cached_bible, cached_summary = _world_summary_cache
+    if cached_bible is world_bible:
+        return cached_summary
+
     lines = []
 
     nation = world_bible.get("nation", {})
@@ -342,13 +590,34 @@ def _build_world_summary(world_bible):
     for org in world_bible.get("fictional_organizations", []):
         lines.append(f"  - {org}")
 
-    return "\n".join(lines)
-
-
-def _extract_tags(script, tag_name):
-    """Extract [TAG: content] values from script text."""
-    pattern = rf'\[{tag_name}:\s*(.+?)\]'
-    return re.findall(pattern, script, re.IGNORECASE)
+    summary = "\n".join(lines)
+    _world_summary_cache = (world_bible, summary)
+    return summary
+
+
+def _extract_all_tags(script):
+    """Extract [TAG: content] values from script text in one pass, as {TAG: [values]}."""
+    tags = {}
+    for name, value in _ALL_TAGS_RE.findall(script):
+        tags.setdefault(name.upper(), []).append(value)
+    return tags
+
+
+# Topic keywords for _classify_topic (a topic scores one point per keyword present)
+_TOPIC_KEYWORDS = {
+    "politics": ["senator", "governor", "president", "legislation", "vote", "bill", "committee", "caucus", "partisan", "bipartisan", "democrat", "republican"],
+    "economics": ["market", "stocks", "inflation", "earnings", "layoffs", "recession", "gdp", "trade deficit", "interest rate", "federal reserve", "wall street", "dow", "nasdaq", "unemployment"],
+    "technology": ["software", "app", "data breach", "hack", "ai ", "artificial intelligence", "startup", "tech", "social media", "algorithm", "silicon valley", "cyber"],
+    "infrastructure": ["bridge", "road", "port", "rail", "construction", "pipeline", "transit", "grid", "highway"],
+    "science": ["study", "research", "university", "species", "lab", "findings", "researchers", "experiment", "peer-reviewed"],
+    "health": ["hospital", "vaccine", "disease", "outbreak", "clinical", "patients", "fda", "cdc", "drug", "pharmaceutical", "medical", "surgeon"],
+    "crime": ["arrest", "police", "suspect", "charges", "detective", "victim", "murder", "robbery", "shooting", "indictment", "convicted"],
+    "international": ["embassy", "foreign", "treaty", "summit", "allies", "sanctions", "diplomat", "nato", "united nations", "overseas"],
+    "education": ["school", "teacher", "student", "campus", "tuition", "curriculum", "superintendent", "school board", "graduation"],
+    "weather": ["storm", "hurricane", "tornado", "flood", "drought", "wildfire", "blizzard", "evacuation", "temperature", "forecast"],
+    "fluff": ["community", "volunteer", "charity", "rescued", "record-breaking", "celebrates", "festival", "tradition", "heartwarming", "milestone"],
+    "sports": ["team", "stadium", "league", "coach", "playoff", "championship", "athlete", "draft", "season"],
+}
 
 
 def _classify_topic(script_text, topic_weights):
@@ -356,22 +625,7 @@ def _classify_topic(script_text, topic_weights):
     text = script_text.lower()
     scores = {}
 
-    keyword_map = {
-        "politics": ["senator", "governor", "president", "legislation", "vote", "bill", "committee", "caucus", "partisan", "bipartisan", "democrat", "republican"],
-        "economics": ["market", "stocks", "inflation", "earnings", "layoffs", "recession", "gdp", "trade deficit", "interest rate", "federal reserve", "wall street", "dow", "nasdaq", "unemployment"],
-        "technology": ["software", "app", "data breach", "hack", "ai ", "artificial intelligence", "startup", "tech", "social media", "algorithm", "silicon valley", "cyber"],
-        "infrastructure": ["bridge", "road", "port", "rail", "construction", "pipeline", "transit", "grid", "highway"],
-        "science": ["study", "research", "university", "species", "lab", "findings", "researchers", "experiment", "peer-reviewed"],
-        "health": ["hospital", "vaccine", "disease", "outbreak", "clinical", "patients", "fda", "cdc", "drug", "pharmaceutical", "medical", "surgeon"],
-        "crime": ["arrest", "police", "suspect", "charges", "detective", "victim", "murder", "robbery", "shooting", "indictment", "convicted"],
-        "international": ["embassy", "foreign", "treaty", "summit", "allies", "sanctions", "diplomat", "nato", "united nations", "overseas"],
-        "education": ["school", "teacher", "student", "campus", "tuition", "curriculum", "superintendent", "school board", "graduation"],
-        "weather": ["storm", "hurricane", "tornado", "flood", "drought", "wildfire", "blizzard", "evacuation", "temperature", "forecast"],
-        "fluff": ["community", "volunteer", "charity", "rescued", "record-breaking", "celebrates", "festival", "tradition", "heartwarming", "milestone"],
-        "sports": ["team", "stadium", "league", "coach", "playoff", "championship", "athlete", "draft", "season"],
-    }
-
-    for topic, keywords in keyword_map.items():
+    for topic, keywords in _TOPIC_KEYWORDS.items():
         scores[topic] = sum(1 for kw in keywords if kw in text)
 
     if max(scores.values()) == 0:
@@ -379,123 +633,152 @@ def _classify_topic(script_text, topic_weights):
     return max(scores, key=scores.get)
 
 
-def _fix_capitalization(script_text):
-    """Fix common capitalization issues in generated scripts."""
-    # Acronyms that must be fully capitalized
-    acronyms = [
-        "EPA", "FBI", "FEMA", "DHS", "FAA", "NLRB", "ACLU", "NATO", "FDA",
-        "CDC", "DOD", "DOE", "HUD", "SEC", "CIA", "NSA", "TSA", "ICE",
-        "OSHA", "IRS", "DOJ", "ATF", "DEA", "NTSB", "USDA", "FCC", "FTC",
-        "NIH", "NOAA", "NASA", "FISA", "NAFTA", "USMCA", "GDP", "GNP",
-        "CEO", "CFO", "COO", "CTO",
-        # Additional common acronyms
-        "HHS", "SCOTUS", "POTUS", "DOT", "USPS", "ICJ", "IMF",
-        "NYPD", "LAPD", "IPO", "NYSE", "NASDAQ", "USCIS", "CBP",
-        "SBA", "GSA", "OPM", "GAO", "CBO", "OMB", "NRC",
-    ]
-
-    # Risky acronyms: only fix if already partially capitalized
-    # (avoids turning common words like "who" or "un" into acronyms)
-    risky_acronyms = ["VA", "WHO", "UN", "EU", "AI"]
-
-    # Country / proper noun pairs: (lowercase pattern, correct form)
-    proper_nouns = [
-        # Countries
-        ("united states", "United States"),
-        ("south korea", "South Korea"),
-        ("north korea", "North Korea"),
-        ("united kingdom", "United Kingdom"),
-        ("saudi arabia", "Saudi Arabia"),
-        ("new zealand", "New Zealand"),
-        ("south africa", "South Africa"),
-        ("puerto rico", "Puerto Rico"),
-        ("costa rica", "Costa Rica"),
-        ("el salvador", "El Salvador"),
-        ("sri lanka", "Sri Lanka"),
-        ("hong kong", "Hong Kong"),
-        # US cities / states
-        ("new york", "New York"),
-        ("los angeles", "Los Angeles"),
-        ("san francisco", "San Francisco"),
-        ("washington d.c.", "Washington D.C."),
-        ("new hampshire", "New Hampshire"),
-        ("new jersey", "New Jersey"),
-        ("new mexico", "New Mexico"),
-        ("rhode island", "Rhode Island"),
-        ("west virginia", "West Virginia"),
-        ("south carolina", "South Carolina"),
-        ("north carolina", "North Carolina"),
-        ("south dakota", "South Dakota"),
-        ("north dakota", "North Dakota"),
-        # Additional US cities
-        ("san antonio", "San Antonio"),
-        ("san diego", "San Diego"),
-        ("las vegas", "Las Vegas"),
-        ("des moines", "Des Moines"),
-        ("el paso", "El Paso"),
-        ("baton rouge", "Baton Rouge"),
-        ("st. louis", "St. Louis"),
-        ("salt lake city", "Salt Lake City"),
-        ("fort worth", "Fort Worth"),
-        ("little rock", "Little Rock"),
-        ("grand rapids", "Grand Rapids"),
-        ("corpus christi", "Corpus Christi"),
-        # Federal departments (full names)
-        ("department of energy", "Department of Energy"),
-        ("department of education", "Department of Education"),
-        ("department of justice", "Department of Justice"),
-        ("department of defense", "Department of Defense"),
-        ("department of homeland security", "Department of Homeland Security"),
-        ("department of transportation", "Department of Transportation"),
-        ("department of state", "Department of State"),
-        ("department of labor", "Department of Labor"),
-        ("department of agriculture", "Department of Agriculture"),
-        ("department of commerce", "Department of Commerce"),
-        ("department of health and human services", "Department of Health and Human Services"),
-        ("department of housing and urban development", "Department of Housing and Urban Development"),
-        ("department of the interior", "Department of the Interior"),
-        ("department of the treasury", "Department of the Treasury"),
-        ("department of veterans affairs", "Department of Veterans Affairs"),
-        # Federal agencies (full names)
-        ("environmental protection agency", "Environmental Protection Agency"),
-        ("federal aviation administration", "Federal Aviation Administration"),
-        ("federal trade commission", "Federal Trade Commission"),
-        ("federal bureau of investigation", "Federal Bureau of Investigation"),
-        ("federal communications commission", "Federal Communications Commission"),
-        ("federal emergency management agency", "Federal Emergency Management Agency"),
-        ("national weather service", "National Weather Service"),
-        ("national security agency", "National Security Agency"),
-        ("securities and exchange commission", "Securities and Exchange Commission"),
-        ("food and drug administration", "Food and Drug Administration"),
-        ("centers for disease control", "Centers for Disease Control"),
-        ("national labor relations board", "National Labor Relations Board"),
-        ("national transportation safety board", "National Transportation Safety Board"),
-        ("internal revenue service", "Internal Revenue Service"),
-        ("bureau of alcohol, tobacco, firearms", "Bureau of Alcohol, Tobacco, Firearms"),
-        ("drug enforcement administration", "Drug Enforcement Administration"),
-        ("occupational safety and health administration", "Occupational Safety and Health Administration"),
-    ]
+def _trie_alternation(words):
+    """
+    Build a case-folded regex alternation for a word list, factored into a
+    prefix trie (e.g. "new (?:york|jersey)") so the matcher branches on one
+    character at a time instead of trying every entry at every position.
+    Longer entries are still preferred, as with a longest-first alternation.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word.lower():
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def _build(node):
+        branches = [re.escape(ch) + _build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        if len(branches) == 1 and "" not in node:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")" + ("?" if "" in node else "")
+
+    return _build(trie)
+
+
+# ---- Capitalization fixer tables ----
+
+# Acronyms that must be fully capitalized
+_ACRONYMS = [
+    "EPA", "FBI", "FEMA", "DHS", "FAA", "NLRB", "ACLU", "NATO", "FDA",
+    "CDC", "DOD", "DOE", "HUD", "SEC", "CIA", "NSA", "TSA", "ICE",
+    "OSHA", "IRS", "DOJ", "ATF", "DEA", "NTSB", "USDA", "FCC", "FTC",
+    "NIH", "NOAA", "NASA", "FISA", "NAFTA", "USMCA", "GDP", "GNP",
+    "CEO", "CFO", "COO", "CTO",
+    # Additional common acronyms
+    "HHS", "SCOTUS", "POTUS", "DOT", "USPS", "ICJ", "IMF",
+    "NYPD", "LAPD", "IPO", "NYSE", "NASDAQ", "USCIS", "CBP",
+    "SBA", "GSA", "OPM", "GAO", "CBO", "OMB", "NRC",
+]
+
+# Risky acronyms: only fix if already partially capitalized
+# (avoids turning common words like "who" or "un" into acronyms)
+_RISKY_ACRONYMS = ["VA", "WHO", "UN", "EU", "AI"]
+
+# Country / proper noun pairs: (lowercase pattern, correct form)
+_PROPER_NOUNS = [
+    # Countries
+    ("united states", "United States"),
+    ("south korea", "South Korea"),
+    ("north korea", "North Korea"),
+    ("united kingdom", "United Kingdom"),
+    ("saudi arabia", "Saudi Arabia"),
+    ("new zealand", "New Zealand"),
+    ("south africa", "South Africa"),
+    ("puerto rico", "Puerto Rico"),
+    ("costa rica", "Costa Rica"),
+    ("el salvador", "El Salvador"),
+    ("sri lanka", "Sri Lanka"),
+    ("hong kong", "Hong Kong"),
+    # US cities / states
+    ("new york", "New York"),
+    ("los angeles", "Los Angeles"),
+    ("san francisco", "San Francisco"),
+    ("washington d.c.", "Washington D.C."),
+    ("new hampshire", "New Hampshire"),
+    ("new jersey", "New Jersey"),
+    ("new mexico", "New Mexico"),
+    ("rhode island", "Rhode Island"),
+    ("west virginia", "West Virginia"),
+    ("south carolina", "South Carolina"),
+    ("north carolina", "North Carolina"),
+    ("south dakota", "South Dakota"),
+    ("north dakota", "North Dakota"),
+    # Additional US cities
+    ("san antonio", "San Antonio"),
+    ("san diego", "San Diego"),
+    ("las vegas", "Las Vegas"),
+    ("des moines", "Des Moines"),
+    ("el paso", "El Paso"),
+    ("baton rouge", "Baton Rouge"),
+    ("st. louis", "St. Louis"),
+    ("salt lake city", "Salt Lake City"),
+    ("fort worth", "Fort Worth"),
+    ("little rock", "Little Rock"),
+    ("grand rapids", "Grand Rapids"),
+    ("corpus christi", "Corpus Christi"),
+    # Federal departments (full names)
+    ("department of energy", "Department of Energy"),
+    ("department of education", "Department of Education"),
+    ("department of justice", "Department of Justice"),
+    ("department of defense", "Department of Defense"),
+    ("department of homeland security", "Department of Homeland Security"),
+    ("department of transportation", "Department of Transportation"),
+    ("department of state", "Department of State"),
+    ("department of labor", "Department of Labor"),
+    ("department of agriculture", "Department of Agriculture"),
+    ("department of commerce", "Department of Commerce"),
+    ("department of health and human services", "Department of Health and Human Services"),
+    ("department of housing and urban development", "Department of Housing and Urban Development"),
+    ("department of the interior", "Department of the Interior"),
+    ("department of the treasury", "Department of the Treasury"),
+    ("department of veterans affairs", "Department of Veterans Affairs"),
+    # Federal agencies (full names)
+    ("environmental protection agency", "Environmental Protection Agency"),
+    ("federal aviation administration", "Federal Aviation Administration"),
+    ("federal trade commission", "Federal Trade Commission"),
+    ("federal bureau of investigation", "Federal Bureau of Investigation"),
+    ("federal communications commission", "Federal Communications Commission"),
+    ("federal emergency management agency", "Federal Emergency Management Agency"),
+    ("national weather service", "National Weather Service"),
+    ("national security agency", "National Security Agency"),
+    ("securities and exchange commission", "Securities and Exchange Commission"),
+    ("food and drug administration", "Food and Drug Administration"),
+    ("centers for disease control", "Centers for Disease Control"),
+    ("national labor relations board", "National Labor Relations Board"),
+    ("national transportation safety board", "National Transportation Safety Board"),
+    ("internal revenue service", "Internal Revenue Service"),
+    ("bureau of alcohol, tobacco, firearms", "Bureau of Alcohol, Tobacco, Firearms"),
+    ("drug enforcement administration", "Drug Enforcement Administration"),
+    ("occupational safety and health administration", "Occupational Safety and Health Administration"),
+]
+
+# All three tables fuse into one alternation (each table a prefix trie), so
+# a script is scanned once; the named group that matched picks the fix.
+# Possessives like DOJ's / EPA's are handled by the (?='s\b|\b) lookahead.
+# Risky acronyms only match their mixed-case form (e.g. "Va" → "VA", not "various")
+_PROPER_NOUN_FORMS = dict(_PROPER_NOUNS)
+_CAPITALIZATION_RE = re.compile(
+    r'(?P<acronym>\b' + _trie_alternation(_ACRONYMS) + r")(?='s\b|\b)"
+    + r'|(?P<risky>(?-i:\b(?:' + '|'.join(a[0].upper() + a[1:].lower() for a in _RISKY_ACRONYMS) + r")))(?='s\b|\b)"
+    + '|' + _trie_alternation(_PROPER_NOUN_FORMS),
+    re.IGNORECASE,
+)
+
+
+def _capitalize_match(match):
+    text = match.group(0)
+    if match.lastgroup in ("acronym", "risky"):
+        return text.upper()
+    return _PROPER_NOUN_FORMS[text.lower()]
 
-    # Fix acronyms using word-boundary matching (case-insensitive)
-    # Also handles possessive forms like DOJ's, EPA's
-    for acr in acronyms:
-        pattern = re.compile(r'\b' + acr + r"(?='s\b|\b)", re.IGNORECASE)
-        script_text = pattern.sub(acr, script_text)
-
-    # Risky acronyms: only uppercase if first letter is already capitalized
-    # (e.g., "Va" → "VA" but not "various" → "VArious")
-    for acr in risky_acronyms:
-        # Match the mixed-case form (first letter upper, rest lower)
-        mixed = acr[0].upper() + acr[1:].lower()
-        pattern = re.compile(r'\b' + re.escape(mixed) + r"(?='s\b|\b)")
-        script_text = pattern.sub(acr, script_text)
-
-    # Fix proper nouns (case-insensitive replacement)
-    for lower_form, correct_form in proper_nouns:
-        pattern = re.compile(re.escape(lower_form), re.IGNORECASE)
-        script_text = pattern.sub(correct_form, script_text)
 
-    return script_text
+def _fix_capitalization(script_text):
+    """Fix common capitalization issues in generated scripts."""
+    # Acronyms → fully uppercase; proper nouns → canonical form
+    return _CAPITALIZATION_RE.sub(_capitalize_match, script_text)
 
 
 # ---- Real-name scrubber (safety net) ----
@@ -585,23 +868,39 @@ _REAL_COMPANIES_MAP = {
 }
 
 
+# Scrubber pattern: both maps fused into one alternation (each a prefix
+# trie; companies whole-word only), with lowercase lookups back to the
+# canonical real name
+_REAL_PEOPLE_LOOKUP = {name.lower(): name for name in _REAL_PEOPLE_MAP}
+_REAL_COMPANIES_LOOKUP = {co.lower(): co for co in _REAL_COMPANIES_MAP}
+_REAL_NAMES_RE = re.compile(
+    r'(?P<person>' + _trie_alternation(_REAL_PEOPLE_MAP) + ')'
+    + r'|\b(?P<company>' + _trie_alternation(_REAL_COMPANIES_MAP) + r')\b',
+    re.IGNORECASE,
+)
+
+
 def _scrub_real_names(script_text):
     """
     Safety-net post-processor: replace any real politician or company names
     that slipped through the prompt instructions with fictional alternatives.
     """
-    # Scrub real people
-    for real_name, fictional_name in _REAL_PEOPLE_MAP.items():
-        pattern = re.compile(re.escape(real_name), re.IGNORECASE)
-        if pattern.search(script_text):
-            script_text = pattern.sub(fictional_name, script_text)
-            print(f"  ⚠ Scrubbed real name: '{real_name}' → '{fictional_name}'")
-
-    # Scrub real companies (word-boundary match to avoid partial hits)
-    for real_co, fictional_co in _REAL_COMPANIES_MAP.items():
-        pattern = re.compile(r'\b' + re.escape(real_co) + r'\b', re.IGNORECASE)
-        if pattern.search(script_text):
-            script_text = pattern.sub(fictional_co, script_text)
-            print(f"  ⚠ Scrubbed real company: '{real_co}' → '{fictional_co}'")
+    people_hits = {}
+    company_hits = {}
+
+    def _replace(match):
+        if match.lastgroup == "person":
+            real_name = _REAL_PEOPLE_LOOKUP[match.group(0).lower()]
+            people_hits[real_name] = _REAL_PEOPLE_MAP[real_name]
+            return _REAL_PEOPLE_MAP[real_name]
+        real_co = _REAL_COMPANIES_LOOKUP[match.group(0).lower()]
+        company_hits[real_co] = _REAL_COMPANIES_MAP[real_co]
+        return _REAL_COMPANIES_MAP[real_co]
+
+    script_text = _REAL_NAMES_RE.sub(_replace, script_text)
+    for real_name, fictional_name in people_hits.items():
+        print(f"  ⚠ Scrubbed real name: '{real_name}' → '{fictional_name}'")
+    for real_co, fictional_co in company_hits.items():
+        print(f"  ⚠ Scrubbed real company: '{real_co}' → '{fictional_co}'")
 
     return script_text
@@ -46,7 +46,7 @@ def run_pilot(config, world_bible, count, dashboard=True):
     from agents.hourly_summary import generate_hourly_summary
     from agents.tts import generate_hourly_audio
     from agents.nonsense import inject_heavy_nonsense
-    from agents.image_gen import generate_story_image
+    from agents.image_gen import generate_story_image, generate_story_images
     from agents.video_gen import generate_video
     from dashboard.app import (
         push_script, push_hourly_summary, push_status,
@@ -180,21 +180,20 @@ def run_pilot(config, world_bible, count, dashboard=True):
             with open(stories_path) as _f:
                 _all = _json.load(_f)
             visible_stories = [s for s in _all if s.get("type") == "story"][:4]
-            backfill_count = 0
+            to_backfill = []
             for vs in visible_stories:
                 d = vs.get("data", {})
                 sid = d.get("story_id", "")
                 img_path = os.path.join("docs", "images", f"{sid}.jpg")
                 if sid and not d.get("image_file") and not os.path.exists(img_path):
                     print(f"  📷 Backfilling image for {sid}...")
-                    try:
-                        img_result = generate_story_image(d, config)
-                        if img_result:
-                            push_story_image(sid, img_result["image_path"])
-                            print(f"  ✓ Backfill image: {sid}")
-                            backfill_count += 1
-                    except Exception as e:
-                        print(f"  ✗ Backfill image error for {sid}: {e}")
+                    to_backfill.append(d)
+            backfill_count = 0
+            for sid, img_result in generate_story_images(to_backfill, config).items():
+                if img_result:
+                    push_story_image(sid, img_result["image_path"])
+                    print(f"  ✓ Backfill image: {sid}")
+                    backfill_count += 1
             if backfill_count:
                 print(f"  Backfilled {backfill_count} missing images")
 